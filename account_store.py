@@ -0,0 +1,346 @@
+# Nom : account_store.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Comptes persistants des joueurs (solde, compteurs, journal des transactions)
+#
+# Deux fichiers :
+#   accounts.json          instantané {"offset": n, "comptes": {nom: {...}}}
+#   accounts.ledger.jsonl  journal des transactions, une entrée JSON par ligne, en ajout seul
+#
+# Le journal fait foi : une transaction est un montant signé appliqué au solde
+# d'un compte. Au chargement, l'instantané est lu puis le journal est rejoué à
+# partir de `offset` (octets déjà pris en compte). Les crédits sont écrits par
+# lots ; plusieurs tables (processus) peuvent partager les mêmes fichiers : sous
+# verrou, chaque écriture applique d'abord les transactions ajoutées par les
+# autres puis ajoute les siennes. Les débits (mise, assurance) sont vérifiés et
+# écrits immédiatement sous ce même verrou : deux tables ne peuvent pas engager
+# le même argent.
+#
+# Un instantané illisible est ignoré : les comptes sont reconstruits à partir
+# du journal seul. Une ligne du journal illisible (écriture interrompue) est
+# ignorée et terminée par un saut de ligne avant l'ajout suivant.
+
+import atexit
+import os
+import threading
+from datetime import datetime
+
+from file_lock import FileLock
+from score_schema import DECODE_ERRORS, dumps, dumps_line, loads
+
+STARTING_BALANCE = 1000
+CHECKPOINT_EVERY = 50  # Écritures du journal entre deux instantanés
+
+# Type de transaction -> compteur incrémenté
+COUNTERS = {"gain": "wins", "perte": "losses", "abandon": "losses", "egalite": "draws"}
+
+
+class Account:
+    """Compte d'un joueur"""
+
+    __slots__ = ("name", "balance", "wins", "losses", "draws")
+
+    def __init__(self, name, balance=STARTING_BALANCE, wins=0, losses=0, draws=0):
+        self.name = name
+        self.balance = balance
+        self.wins = wins
+        self.losses = losses
+        self.draws = draws
+
+    def to_dict(self):
+        return {"solde": self.balance, "victoires": self.wins,
+                "defaites": self.losses, "egalites": self.draws}
+
+
+class AccountStore:
+    """Comptes des joueurs indexés par nom (accès en O(1))"""
+
+    def __init__(self, filename="accounts.json", batch_size=32, flush_interval=2.0, sync=False):
+        """Ouvre (ou crée) le stock de comptes
+
+        Args:
+            filename (str): Instantané des comptes (le journal est <nom>.ledger.jsonl)
+            batch_size (int): Nombre de transactions regroupées par écriture
+            flush_interval (float): Délai maximal en secondes avant l'écriture des
+                transactions en attente (None = pas de limite de temps)
+            sync (bool): fsync du journal à chaque écriture
+        """
+        self.filename = filename
+        self.ledger_file = os.path.splitext(filename)[0] + ".ledger.jsonl"
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.sync = sync
+        self.accounts = {}
+        self._pending = []
+        self._offset = 0       # Octets du journal déjà appliqués
+        self._torn = 0         # Octets d'une ligne incomplète en fin de journal
+        self._writes = 0
+        self._lock = threading.RLock()
+        self._timer = None
+        self._file_lock = FileLock(filename)
+        atexit.register(self.close)
+        self._load()
+
+    def __len__(self):
+        return len(self.accounts)
+
+    def __contains__(self, name):
+        return name in self.accounts
+
+    def get(self, name):
+        """Retourne le compte `name` (ou None s'il n'existe pas)"""
+        return self.accounts.get(name)
+
+    # -------------------- Chargement --------------------
+    def _load(self):
+        """Lit l'instantané puis rejoue la fin du journal"""
+        try:
+            with self._file_lock:
+                if os.path.exists(self.filename):
+                    try:
+                        self._read_snapshot()
+                    except DECODE_ERRORS + (KeyError, TypeError, AttributeError) as e:
+                        # Instantané partiel ou corrompu : reconstruction à partir du journal seul
+                        print(f"Erreur lors du chargement des comptes: {e}")
+                        self.accounts = {}
+                        self._offset = 0
+                self._catch_up()
+        except IOError as e:
+            print(f"Erreur lors du chargement des comptes: {e}")
+
+    def _read_snapshot(self):
+        with open(self.filename, 'rb') as f:
+            snapshot = loads(f.read())
+        for name, data in snapshot["comptes"].items():
+            self.accounts[name] = Account(name, data["solde"], data["victoires"],
+                                          data["defaites"], data["egalites"])
+        self._offset = snapshot["offset"]
+
+    def _catch_up(self):
+        """Applique les transactions ajoutées au journal depuis la dernière lecture (sous verrou)"""
+        if not os.path.exists(self.ledger_file):
+            return
+        with open(self.ledger_file, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Une ligne incomplète en fin de fichier (écriture interrompue) est laissée de côté
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line:
+                continue
+            try:
+                self._apply(loads(line))
+            except DECODE_ERRORS + (KeyError, TypeError) as e:
+                print(f"Erreur lors de la lecture du journal des comptes (ligne ignorée): {e}")
+        self._offset += end
+        self._torn = len(data) - end
+
+    def _apply(self, entry):
+        """Applique une transaction du journal aux comptes en mémoire"""
+        name = entry["nom"]
+        account = self.accounts.get(name)
+        if entry["type"] == "ouverture":
+            # Compte ouvert en même temps par deux tables : seule la première ouverture compte
+            if account is None:
+                self.accounts[name] = Account(name, entry["montant"])
+            return
+        if account is None:
+            account = self.accounts[name] = Account(name, 0)
+        account.balance += entry["montant"]
+        counter = COUNTERS.get(entry["type"])
+        if counter:
+            setattr(account, counter, getattr(account, counter) + 1)
+
+    # -------------------- Transactions --------------------
+    def open(self, name, balance=STARTING_BALANCE):
+        """Retourne le compte `name`, créé avec `balance` s'il n'existe pas"""
+        account = self.accounts.get(name)
+        if account is None:
+            self._append({"nom": name, "type": "ouverture", "montant": balance})
+            account = self.accounts[name]
+        return account
+
+    def record(self, name, kind, amount):
+        """Enregistre une transaction et met à jour le compte
+
+        Args:
+            name (str): Nom du joueur
+            kind (str): Type (mise, gain, perte, egalite, abandon, assurance, annulation, reprise)
+            amount (float): Montant signé (négatif : débit du compte)
+
+        Returns:
+            Account: Compte mis à jour
+        """
+        self._append({"nom": name, "type": kind, "montant": amount})
+        return self.accounts[name]
+
+    def debit(self, name, kind, amount):
+        """Débite un compte si son solde, transactions des autres tables comprises, suffit
+
+        Vérification et écriture se font sous le verrou du fichier, sans attendre
+        le lot suivant : les autres tables voient le débit dès leur prochaine lecture.
+
+        Args:
+            name (str): Nom du joueur
+            kind (str): Type (mise, assurance)
+            amount (float): Montant à débiter (positif)
+
+        Returns:
+            bool: True si le débit est enregistré, False si le solde est
+                insuffisant ou en cas d'erreur
+        """
+        with self._lock:
+            self._cancel_timer()
+            entry = None
+            try:
+                with self._file_lock:
+                    self._catch_up()
+                    account = self.accounts.get(name)
+                    if account is None or amount <= 0 or amount > account.balance:
+                        return False
+                    entry = self._stage({"nom": name, "type": kind, "montant": -amount})
+                    self._write_pending()
+                return True
+            except IOError as e:
+                print(f"Erreur lors de l'enregistrement des comptes: {e}")
+                if entry is not None and entry in self._pending:
+                    # Débit non écrit : il n'a pas eu lieu
+                    self._pending.remove(entry)
+                    self.accounts[name].balance += amount
+                return False
+
+    def _stage(self, entry):
+        """Applique une transaction et la met en attente d'écriture (sous verrou)"""
+        self._apply(entry)
+        entry["solde"] = self.accounts[entry["nom"]].balance
+        entry["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        self._pending.append(entry)
+        return entry
+
+    def _append(self, entry):
+        with self._lock:
+            self._stage(entry)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+            elif self.flush_interval and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def flush(self):
+        """Écrit les transactions en attente à la fin du journal
+
+        Returns:
+            bool: True si rien n'était en attente ou si l'écriture a réussi
+        """
+        with self._lock:
+            self._cancel_timer()
+            if not self._pending:
+                return True
+            try:
+                with self._file_lock:
+                    # Transactions des autres tables d'abord, puis les nôtres
+                    self._catch_up()
+                    self._write_pending()
+                return True
+            except IOError as e:
+                print(f"Erreur lors de l'enregistrement des comptes: {e}")
+                return False
+
+    def _write_pending(self):
+        """Ajoute les transactions en attente au journal (sous verrou, journal rattrapé)"""
+        data = b"".join(dumps_line(entry) for entry in self._pending)
+        if self._torn:
+            # Ligne interrompue (sous verrou, personne n'écrit) : elle est
+            # terminée pour que notre première transaction reste lisible
+            data = b"\n" + data
+            self._offset += self._torn
+            self._torn = 0
+        with open(self.ledger_file, 'ab') as f:
+            f.write(data)
+            if self.sync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._offset += len(data)
+        self._pending = []
+        self._writes += 1
+        if self._writes % CHECKPOINT_EVERY == 0:
+            self._write_snapshot()
+
+    def refresh(self):
+        """Applique les transactions écrites par les autres tables depuis la dernière lecture
+
+        Returns:
+            bool: True si la lecture a réussi, False sinon
+        """
+        with self._lock:
+            try:
+                with self._file_lock:
+                    self._catch_up()
+                return True
+            except IOError as e:
+                print(f"Erreur lors de la lecture des comptes: {e}")
+                return False
+
+    def _write_snapshot(self):
+        """Écrit l'instantané des comptes (sous verrou, journal entièrement appliqué)"""
+        snapshot = {"offset": self._offset,
+                    "comptes": {name: account.to_dict() for name, account in self.accounts.items()}}
+        tmp_path = self.filename + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps(snapshot))
+        os.replace(tmp_path, self.filename)
+
+    def checkpoint(self):
+        """Écrit les transactions en attente puis un instantané (chargement plus rapide)
+
+        Returns:
+            bool: True si l'écriture a réussi, False sinon
+        """
+        with self._lock:
+            if not self.flush():
+                return False
+            try:
+                with self._file_lock:
+                    self._catch_up()
+                    self._write_snapshot()
+                return True
+            except IOError as e:
+                print(f"Erreur lors de l'enregistrement des comptes: {e}")
+                return False
+
+    def close(self):
+        """Écrit tout ce qui est en attente (appelé aussi à la fin du programme)"""
+        if self._pending or self._writes:
+            self.checkpoint()
+            self._writes = 0
+
+    # -------------------- Consultation --------------------
+    def transactions(self, name=None):
+        """Parcourt le journal (transactions écrites puis en attente)
+
+        Args:
+            name (str): Seulement les transactions de ce joueur
+
+        Returns:
+            generator: Entrées du journal, de la plus ancienne à la plus récente
+        """
+        if os.path.exists(self.ledger_file):
+            with open(self.ledger_file, 'rb') as f:
+                for line in f:
+                    if line.endswith(b"\n"):
+                        try:
+                            entry = loads(line)
+                        except DECODE_ERRORS:
+                            continue  # Ligne interrompue
+                        if name is None or entry.get("nom") == name:
+                            yield entry
+        for entry in list(self._pending):
+            if name is None or entry["nom"] == name:
+                yield entry
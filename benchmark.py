@@ -0,0 +1,365 @@
+# Nom : benchmark.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Suite de benchmarks des chemins critiques (moteur, scores, persistance, rendu)
+#
+# Utilisation :
+#   python benchmark.py --sizes 1000 100000 --output resultats.json
+#   python benchmark.py --baseline baseline.json --tolerance 0.15
+#   python benchmark.py --gui      (rendu Tk, sous Xvfb si aucun affichage n'est disponible)
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from blackjack import BlackjackGame
+from hand import Hand
+from rules import SUITS, VALUES
+from score_manager import ScoreManager
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+DEFAULT_SEED = 1234
+# Import avec dédoublonnage quadratique : au-delà, le benchmark est ignoré
+IMPORT_MAX_SIZE = 10000
+RESULTS = ("win", "lose", "draw", "blackjack")
+
+
+# -------------------- Données synthétiques --------------------
+def make_history(size, seed=DEFAULT_SEED):
+    """Génère un historique de manches au format de ScoreManager
+
+    Args:
+        size (int): Nombre de manches
+        seed (int): Graine du générateur
+
+    Returns:
+        list: Liste d'entrées de scores
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 12, 17, 14, 0, 0)
+    balance1 = balance2 = 1000
+    history = []
+    for idx in range(size):
+        balance1 += rng.choice((-10, 10, 15, 0))
+        balance2 += rng.choice((-10, 10, 15, 0))
+        history.append({
+            "id": f"{idx:08x}",
+            "timestamp": (start + timedelta(seconds=idx)).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+            "joueur1": {"nom": "Joueur 1", "resultat": rng.choice(RESULTS),
+                        "score": rng.randint(12, 21), "solde": balance1},
+            "joueur2": {"nom": "Joueur 2", "resultat": rng.choice(RESULTS),
+                        "score": rng.randint(12, 21), "solde": balance2},
+            "croupier": {"score": rng.randint(17, 26)}
+        })
+    return history
+
+
+def _write_history(directory, size, seed):
+    path = os.path.join(directory, f"history_{size}.json")
+    if not os.path.exists(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(make_history(size, seed), f, indent=2, ensure_ascii=False)
+    return path
+
+
+def _timeit(func, repeat):
+    """Retourne le meilleur temps (secondes) sur plusieurs répétitions"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+# -------------------- Benchmarks --------------------
+def bench_get_score(size, seed, workdir):
+    """Score de `size` mains de trois cartes"""
+    rng = random.Random(seed)
+    deck = [(value, suit) for suit in SUITS for value in VALUES]
+    hands = []
+    for _ in range(size):
+        hand = Hand()
+        for card in rng.sample(deck, 3):
+            hand.add_card(card)
+        hands.append(hand)
+
+    def run():
+        for hand in hands:
+            hand.get_score()
+    return run, size
+
+
+def bench_draw_card(size, seed, workdir):
+    """Création du paquet et tirage de `size` cartes"""
+    game = BlackjackGame(score_file=None)
+
+    def run():
+        random.seed(seed)
+        game.create_deck()
+        draw = game.draw_card
+        for _ in range(size):
+            draw()
+    return run, size
+
+
+def bench_rounds(size, seed, workdir):
+    """Manches complètes sans interface (distribution, croupier, règlement)"""
+    game = BlackjackGame(score_file=None)
+
+    def run():
+        random.seed(seed)
+        game.create_deck()
+        for _ in range(size):
+            game.player1.balance = game.player2.balance = 1000
+            game.player1.place_bet(10)
+            game.player2.place_bet(10)
+            game.start_new_round()
+            game.stand(game.player1)
+            game.stand(game.player2)
+            game.dealer_play()
+            game.settle_player(game.player1)
+            game.settle_player(game.player2)
+    return run, size
+
+
+def bench_add_score(size, seed, workdir, appends=10):
+    """Ajout de manches sur un historique de `size` manches (sauvegarde complète)"""
+    source = _write_history(workdir, size, seed)
+    target = os.path.join(workdir, "add_score.json")
+    shutil.copyfile(source, target)
+    manager = ScoreManager(target)
+
+    def run():
+        for _ in range(appends):
+            manager.add_score("Joueur 1", "win", 20, 1010, "Joueur 2", "lose", 18, 990, 19)
+        del manager.scores[-appends:]
+    return run, appends
+
+
+def bench_load_scores(size, seed, workdir):
+    """Chargement d'un historique de `size` manches"""
+    path = _write_history(workdir, size, seed)
+    manager = ScoreManager(os.path.join(workdir, "vide.json"))
+    manager.filename = path
+
+    def run():
+        manager._load_scores()
+    return run, size
+
+
+def bench_import_scores(size, seed, workdir):
+    """Importation d'un historique de `size` manches dans un gestionnaire vide"""
+    if size > IMPORT_MAX_SIZE:
+        return None, f"ignoré au-delà de {IMPORT_MAX_SIZE} manches (dédoublonnage quadratique)"
+    source = _write_history(workdir, size, seed)
+    target = os.path.join(workdir, "import.json")
+
+    def run():
+        if os.path.exists(target):
+            os.remove(target)
+        ScoreManager(target).import_scores(source)
+    return run, size
+
+
+def bench_player_stats(size, seed, workdir):
+    """Statistiques d'un joueur sur un historique de `size` manches"""
+    manager = ScoreManager(os.path.join(workdir, "vide.json"))
+    manager.scores = make_history(size, seed)
+
+    def run():
+        manager.get_player_stats("Joueur 1")
+    return run, size
+
+
+ENGINE_BENCHMARKS = {
+    "get_score": bench_get_score,
+    "draw_card": bench_draw_card,
+    "rounds": bench_rounds,
+}
+PERSISTENCE_BENCHMARKS = {
+    "add_score": bench_add_score,
+    "load_scores": bench_load_scores,
+    "import_scores": bench_import_scores,
+    "get_player_stats": bench_player_stats,
+}
+
+
+# -------------------- Rendu (GUI) --------------------
+def _ensure_display():
+    """Démarre Xvfb si aucun affichage n'est disponible
+
+    Returns:
+        subprocess.Popen | None: Processus Xvfb lancé (à arrêter), None sinon
+    """
+    if os.environ.get("DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        raise RuntimeError("aucun affichage et Xvfb introuvable")
+    display = ":97"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x800x24"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return process
+
+
+def run_gui_benchmarks(sizes, seed, repeat):
+    """Mesure le rendu des cartes sur une table construite sans dialogues
+
+    Le temps par image de la table (calcul et dessin Tk) est rapporté sous
+    "frame_time" (voir TableCanvas.frame_stats).
+    """
+    results = {}
+    xvfb = None
+    try:
+        xvfb = _ensure_display()
+        import tkinter as tk
+        from gui import BlackjackGUI
+
+        root = tk.Tk()
+        app = BlackjackGUI.__new__(BlackjackGUI)
+        app.root = root
+        app.image_cache = {}
+        app._load_back_image()
+        app._build_layout()
+        app.table.animate = False
+        rng = random.Random(seed)
+        deck = [(value, suit) for suit in SUITS for value in VALUES]
+        for size in sizes:
+            hands = [rng.sample(deck, 3) for _ in range(min(size, 1000))]
+
+            def run():
+                for cards in hands:
+                    app.table.set_cards("p1", cards)
+                    app.table.render()
+                    app.table.clear()
+            seconds = _timeit(run, repeat)
+            results[f"render_cards[{size}]"] = _record(size, len(hands), seconds)
+        results["frame_time"] = app.table.frame_stats()
+        root.destroy()
+    except Exception as e:  # Pas d'affichage, pas de PIL...
+        results["render_cards"] = {"skipped": str(e)}
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    return results
+
+
+# -------------------- Exécution et comparaison --------------------
+def _record(size, operations, seconds):
+    return {
+        "size": size,
+        "operations": operations,
+        "seconds": seconds,
+        "ops_per_sec": operations / seconds if seconds else None
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, seed=DEFAULT_SEED, repeat=3, gui=False, only=None):
+    """Exécute la suite et retourne un rapport lisible par machine
+
+    Args:
+        sizes (iterable): Tailles d'historique / nombres de manches
+        seed (int): Graine fixe pour des données reproductibles
+        repeat (int): Répétitions par mesure (le meilleur temps est retenu)
+        gui (bool): Inclure les benchmarks de rendu Tk
+        only (iterable): Noms des benchmarks à exécuter (tous par défaut)
+
+    Returns:
+        dict: {"meta": {...}, "results": {nom[taille]: mesure}}
+    """
+    benchmarks = dict(ENGINE_BENCHMARKS, **PERSISTENCE_BENCHMARKS)
+    if only:
+        benchmarks = {name: func for name, func in benchmarks.items() if name in only}
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="blackjack-bench-")
+    try:
+        for name, func in benchmarks.items():
+            for size in sizes:
+                key = f"{name}[{size}]"
+                run, operations = func(size, seed, workdir)
+                if run is None:
+                    results[key] = {"size": size, "skipped": operations}
+                    continue
+                results[key] = _record(size, operations, _timeit(run, repeat))
+                print(f"{key:32s} {results[key]['ops_per_sec']:>14,.0f} ops/s", file=sys.stderr)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if gui:
+        results.update(run_gui_benchmarks(sizes, seed, repeat))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        },
+        "results": results
+    }
+
+
+def compare(report, baseline, tolerance=0.10):
+    """Compare un rapport à une référence
+
+    Args:
+        report (dict): Rapport courant
+        baseline (dict): Rapport de référence
+        tolerance (float): Baisse de débit tolérée (0.10 = 10 %)
+
+    Returns:
+        list: Régressions (nom, débit de référence, débit courant)
+    """
+    regressions = []
+    for key, ref in baseline.get("results", {}).items():
+        current = report["results"].get(key)
+        if not current or not ref.get("ops_per_sec") or not current.get("ops_per_sec"):
+            continue
+        if current["ops_per_sec"] < ref["ops_per_sec"] * (1 - tolerance):
+            regressions.append((key, ref["ops_per_sec"], current["ops_per_sec"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks des chemins critiques du Blackjack")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="benchmarks à exécuter")
+    parser.add_argument("--gui", action="store_true", help="inclure le rendu Tk (Xvfb si besoin)")
+    parser.add_argument("--output", help="fichier JSON de sortie (stdout par défaut)")
+    parser.add_argument("--baseline", help="rapport JSON de référence à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.seed, args.repeat, args.gui, args.only)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for key, ref, current in regressions:
+            print(f"RÉGRESSION {key}: {ref:,.0f} -> {current:,.0f} ops/s", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
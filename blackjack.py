@@ -2,64 +2,108 @@
 # Auteur : Arda Tuna Kaya
 # Mise à jour : Leonardo Rodrigues
 # Date : 05.01.2026
-# Version : 2.0
+# Version : 2.1
 # Description : Logique principale du jeu Blackjack
 # Changements v2.0 : Intégration ScoreManager, persistance des balances
+# Changements v2.1 : Double, séparation, assurance et abandon tardif,
+#                    règles configurables compilées en tables, suivi du sabot,
+#                    cartes enregistrées avec la manche, comptes persistants des joueurs,
+#                    événements pour les observateurs (voir events.py)
 
+import os
 import random
+from account_store import AccountStore
 from player import Player
 from dealer import Dealer
+from events import EventBus
+from hand import Hand
+from rules import Rules
 from score_manager import ScoreManager
+from shoe_tracker import ShoeTracker
 
 class BlackjackGame:
     """Classe principale gérant la logique du jeu"""
     
-    def __init__(self):
+    def __init__(self, rules=None, count_systems=("hilo",), score_file="scores.json", accounts_file=None,
+                 autosave=False, rng=None):
+        # Générateur du mélange : propre à la partie si fourni (simulation reproductible)
+        self.rng = rng if rng is not None else random
+        # Règles de la table, compilées une seule fois en tables de décision
+        self.rules = rules if rules is not None else Rules()
+        self.tables = self.rules.compile()
         self.deck = []
+        # Composition du sabot et comptes de cartes, mis à jour à chaque tirage
+        self.shoe = ShoeTracker(self.rules.decks, count_systems)
         # Gestionnaire des scores pour l'enregistrement des manches
-        self.score_manager = ScoreManager()
+        # (score_file=None : partie sans historique, ex. simulation)
+        self.score_manager = ScoreManager(score_file) if score_file else None
+        # Comptes des joueurs (solde, compteurs, journal), par défaut à côté de l'historique
+        if accounts_file is None and score_file:
+            accounts_file = os.path.join(os.path.dirname(score_file), "accounts.json")
+        self.accounts = AccountStore(accounts_file) if accounts_file else None
         
-        # Récupérer les derniers soldes si disponibles
-        last_balances = self.score_manager.get_last_balances()
-        p1_balance = last_balances.get("Joueur 1", 1000)
-        p2_balance = last_balances.get("Joueur 2", 1000)
-        
-        self.player1 = Player("Joueur 1", p1_balance)
-        self.player2 = Player("Joueur 2", p2_balance)
-        self.dealer = Dealer()
+        # Un compte qui n'existe pas encore part du dernier solde de l'historique
+        # (reprise des parties antérieures aux comptes), sinon de 1000
+        last_balances = self.score_manager.get_last_balances() if self.score_manager else {}
+        self.player1 = Player("Joueur 1", last_balances.get("Joueur 1", 1000), self.accounts)
+        self.player2 = Player("Joueur 2", last_balances.get("Joueur 2", 1000), self.accounts)
+        self.dealer = Dealer(self.tables)
         self.current_player = None
         self.game_state = "betting"  # betting, playing, dealer_turn, finished
+        self._results = None  # Résultats de la manche, calculés une seule fois
+        self._settled = None  # Résultats et mises du joueur 1 en attente (autosave)
+        
+        # Observateurs (interface, persistance, mesures)
+        self.events = EventBus()
+        if autosave and self.score_manager:
+            # Chaque manche soldée est enregistrée dans l'historique
+            self.events.subscribe("settlement", self._autosave)
         
     def create_deck(self):
-        """Crée un jeu de 52 cartes"""
-        suits = ['♠', '♥', '♦', '♣']
-        values = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        self.deck = [(value, suit) for suit in suits for value in values]
-        random.shuffle(self.deck)
+        """Crée le sabot (52 cartes par paquet) et le mélange"""
+        self.deck = list(self.tables.shoe)
+        self.rng.shuffle(self.deck)
+        self.shoe.reset()
     
     def draw_card(self):
         """Tire une carte du paquet"""
-        if len(self.deck) < 10:
+        if len(self.deck) < self.tables.emergency_reshuffle:
             self.create_deck()
-        return self.deck.pop()
+        card = self.deck.pop()
+        self.shoe.draw(card)
+        return card
+    
+    def deal_to(self, player, hidden=False):
+        """Tire une carte pour un joueur ou le croupier (événement card_dealt)"""
+        card = self.draw_card()
+        player.add_card(card)
+        if self.events.listeners:
+            self.events.emit("card_dealt", player=player, card=card, hidden=hidden)
+        return card
     
     def start_new_round(self):
         """Démarre une nouvelle manche"""
         self.player1.reset_hand()
         self.player2.reset_hand()
         self.dealer.reset_hand()
+        self._results = None
         
-        if len(self.deck) < 20:
+        if len(self.deck) < self.tables.reshuffle_at:
             self.create_deck()
+        if self.events.listeners:
+            self.events.emit("round_start")
         
         # Distribution initiale : 2 cartes pour chaque joueur et le croupier
-        for _ in range(2):
-            self.player1.add_card(self.draw_card())
-            self.player2.add_card(self.draw_card())
-            self.dealer.add_card(self.draw_card())
+        # (la seconde carte du croupier est cachée)
+        for idx in range(2):
+            self.deal_to(self.player1)
+            self.deal_to(self.player2)
+            self.deal_to(self.dealer, hidden=idx == 1)
         
         self.current_player = self.player1
         self.game_state = "playing"
+        if self.events.listeners:
+            self.events.emit("turn_change", player=self.player1)
         
         # Vérifier les Blackjacks naturels
         if self.player1.has_blackjack():
@@ -69,10 +113,11 @@ class BlackjackGame:
     
     def hit(self, player):
         """Le joueur tire une carte"""
-        card = self.draw_card()
-        player.add_card(card)
+        self.deal_to(player)
         
         if player.check_bust():
+            if self.events.listeners:
+                self.events.emit("bust", player=player)
             return "bust"
         elif player.get_score() == 21:
             return "21"
@@ -81,86 +126,282 @@ class BlackjackGame:
     def stand(self, player):
         """Le joueur reste"""
         player.is_standing = True
+        if self.events.listeners:
+            self.events.emit("stand", player=player)
+    
+    def double_down(self, player):
+        """Le joueur double sa mise, tire une seule carte puis reste
+        
+        Returns:
+            str: "bust", "21", "continue" ou None si le double est impossible
+        """
+        hand = player.current_hand
+        if not self.can_double(player) or not player.add_to_bet(hand, hand.bet):
+            return None
+        hand.is_doubled = True
+        result = self.hit(player)
+        hand.is_standing = True
+        if self.events.listeners:
+            self.events.emit("stand", player=player)
+        return result
+    
+    def can_double(self, player):
+        """Vérifie si la main active du joueur peut être doublée"""
+        hand = player.current_hand
+        tables = self.tables
+        return (len(hand) == 2 and not hand.is_standing and tables.can_double[hand.get_score()]
+                and (tables.double_after_split or not hand.is_split)
+                and not self._is_split_aces(hand)
+                and hand.bet <= player.balance)
+    
+    def can_split(self, player):
+        """Vérifie si la main active du joueur peut être séparée"""
+        hand = player.current_hand
+        if self._is_split_aces(hand):
+            if not self.tables.resplit_aces:
+                return False
+        elif hand.is_standing:
+            return False
+        return (hand.can_split() and len(player.hands) < self.tables.max_hands
+                and hand.bet <= player.balance)
+    
+    def split(self, player):
+        """Sépare une paire en deux mains, chacune recevant une nouvelle carte
+        
+        Returns:
+            bool: True si la séparation a eu lieu, False sinon
+        """
+        if not self.can_split(player):
+            return False
+        hand = player.current_hand
+        new_hand = Hand()
+        # Mise refusée (solde dépensé entre-temps sur une autre table) : aucune main ne change
+        if not player.add_to_bet(new_hand, hand.bet):
+            return False
+        new_hand.add_card(hand.pop_card())
+        hand.is_split = True
+        new_hand.is_split = True
+        player.hands.insert(player.active_hand + 1, new_hand)
+        for split_hand in (hand, new_hand):
+            card = self.draw_card()
+            split_hand.add_card(card)
+            if self.events.listeners:
+                self.events.emit("card_dealt", player=player, card=card, hidden=False)
+        
+        # As séparés : une seule carte par main ; une nouvelle paire d'As reste
+        # ouverte si la re-séparation est permise (voir can_player_act)
+        if hand.cards[0][0] == 'A':
+            for split_hand in (hand, new_hand):
+                split_hand.is_standing = not (self.tables.resplit_aces and split_hand.can_split())
+        return True
+    
+    @staticmethod
+    def _is_split_aces(hand):
+        """Main issue de la séparation d'une paire d'As"""
+        return hand.is_split and hand.cards[0][0] == 'A'
+    
+    def can_insure(self):
+        """L'assurance est proposée quand la carte visible du croupier est un As"""
+        card = self.dealer.get_visible_card()
+        return self.tables.insurance and card is not None and card[0] == 'A'
+    
+    def insurance(self, player):
+        """Le joueur prend l'assurance (moitié de sa mise initiale)"""
+        if not self.can_insure() or player.insurance_bet or len(player.hands) > 1:
+            return False
+        return player.place_insurance(player.hands[0].bet / 2)
+    
+    def surrender(self, player):
+        """Abandon tardif : uniquement comme première action sur la main initiale"""
+        hand = player.current_hand
+        if (not self.tables.surrender or len(player.hands) != 1
+                or len(hand) != 2 or hand.is_standing):
+            return False
+        hand.is_surrendered = True
+        hand.is_standing = True
+        if self.events.listeners:
+            self.events.emit("stand", player=player)
+        return True
     
     def switch_player(self):
-        """Passe au joueur suivant"""
+        """Passe à la main suivante du joueur, puis au joueur suivant"""
+        if self.current_player is not None and self.current_player.next_hand():
+            if self.events.listeners:
+                self.events.emit("turn_change", player=self.current_player)
+            return True
         if self.current_player == self.player1:
             self.current_player = self.player2
+            if self.events.listeners:
+                self.events.emit("turn_change", player=self.player2)
             return True
         else:
             self.current_player = None
             self.game_state = "dealer_turn"
+            if self.events.listeners:
+                self.events.emit("turn_change", player=None)
             return False
     
     def dealer_play(self):
         """Le croupier joue automatiquement"""
         while self.dealer.should_draw():
-            card = self.draw_card()
-            self.dealer.add_card(card)
+            self.deal_to(self.dealer)
         
-        self.dealer.check_bust()
+        if self.dealer.check_bust() and self.events.listeners:
+            self.events.emit("bust", player=self.dealer)
         self.game_state = "finished"
     
-    def determine_winner(self, player):
-        """Détermine le résultat pour un joueur"""
-        if player.is_busted:
-            player.lose_bet()
+    def determine_winner(self, player, hand=None):
+        """Détermine le résultat pour une main d'un joueur (main active par défaut)"""
+        if hand is None:
+            hand = player.current_hand
+        
+        if hand.is_busted:
+            player.lose_bet(hand)
             return "lose", "Dépassé 21"
         
+        dealer_blackjack = self.dealer.has_blackjack()
+        
+        # Abandon tardif : perdu en entier si le croupier a un Blackjack
+        if hand.is_surrendered:
+            if dealer_blackjack:
+                player.lose_bet(hand)
+                return "lose", "Croupier a Blackjack"
+            player.surrender_bet(hand)
+            return "surrender", "Abandon"
+        
         dealer_score = self.dealer.get_score()
-        player_score = player.get_score()
+        player_score = hand.get_score()
+        player_blackjack = hand.has_blackjack()
         
         # Blackjack naturel du joueur
-        if player.has_blackjack() and not self.dealer.has_blackjack():
-            player.win_bet(2.5)  # Paye 3:2
+        if player_blackjack and not dealer_blackjack:
+            player.win_bet(self.tables.natural_multiplier, hand)  # 3:2 par défaut
             return "blackjack", "Blackjack!"
         
         # Blackjack du croupier
-        if self.dealer.has_blackjack() and not player.has_blackjack():
-            player.lose_bet()
+        if dealer_blackjack and not player_blackjack:
+            player.lose_bet(hand)
             return "lose", "Croupier a Blackjack"
         
         # Croupier dépassé
         if self.dealer.is_busted:
-            player.win_bet()
+            player.win_bet(hand=hand)
             return "win", "Croupier dépassé"
         
         # Comparaison des scores
         if player_score > dealer_score:
-            player.win_bet()
+            player.win_bet(hand=hand)
             return "win", f"{player_score} vs {dealer_score}"
         elif player_score < dealer_score:
-            player.lose_bet()
+            player.lose_bet(hand)
             return "lose", f"{player_score} vs {dealer_score}"
         else:
-            player.draw_bet()
+            player.draw_bet(hand)
             return "draw", f"Égalité à {player_score}"
     
+    def settle_player(self, player):
+        """Solde l'assurance puis chaque main du joueur
+        
+        Returns:
+            list: Résultats (statut, message) de chaque main
+        """
+        player.settle_insurance(self.dealer.has_blackjack())
+        if self.events.listeners:
+            bets = [hand.bet for hand in player.hands]  # Remises à zéro par le règlement
+            results = [self.determine_winner(player, hand) for hand in player.hands]
+            self.events.emit("settlement", player=player, results=results, bets=bets)
+            return results
+        return [self.determine_winner(player, hand) for hand in player.hands]
+    
     def can_player_act(self, player):
-        """Vérifie si le joueur peut encore agir"""
-        return not player.is_busted and not player.is_standing
+        """Vérifie si le joueur peut encore agir
+        
+        Sur des As séparés restés ouverts, seule une nouvelle séparation est
+        possible : la main est terminée dès qu'elle ne peut plus être séparée.
+        """
+        if player.is_busted or player.is_standing:
+            return False
+        if self._is_split_aces(player.current_hand):
+            return self.can_split(player)
+        return True
     
     def get_game_results(self):
-        """Retourne les résultats finaux pour les deux joueurs"""
-        result1 = self.determine_winner(self.player1)
-        result2 = self.determine_winner(self.player2)
-        return {
-            'player1': result1,
-            'player2': result2,
-            'dealer_score': self.dealer.get_score()
-        }
+        """Retourne les résultats finaux pour les deux joueurs
+        
+        La manche n'est soldée qu'au premier appel ; les appels suivants
+        (enregistrement des scores) retournent les mêmes résultats.
+        """
+        if self._results is None:
+            # Mises de chaque main, relevées avant le règlement qui les remet à zéro
+            bets1 = [hand.bet for hand in self.player1.hands]
+            bets2 = [hand.bet for hand in self.player2.hands]
+            results1 = self.settle_player(self.player1)
+            results2 = self.settle_player(self.player2)
+            self._results = {
+                'player1': results1[0],
+                'player2': results2[0],
+                'player1_hands': results1,
+                'player2_hands': results2,
+                'player1_bets': bets1,
+                'player2_bets': bets2,
+                'dealer_score': self.dealer.get_score()
+            }
+        return self._results
+    
+    def restore_balances(self, balances):
+        """Reprend des soldes importés {nom: solde} (écart enregistré dans les comptes)"""
+        for player in (self.player1, self.player2):
+            if player.name in balances:
+                player.set_balance(balances[player.name])
+    
+    def _autosave(self, event, player, results, bets):
+        # Abonné à "settlement" : la manche est enregistrée une fois les deux joueurs soldés
+        if player is self.player1:
+            self._settled = (results, bets)
+        elif player is self.player2:
+            self._record_score(*self._settled, results, bets)
     
     def save_game_score(self):
-        """Enregistre les résultats de la manche actuelle dans l'historique"""
+        """Enregistre les résultats de la manche actuelle dans l'historique
+        
+        Les cartes sont enregistrées avec la manche (toutes les mains de
+        chaque joueur) pour pouvoir la revoir.
+        """
         results = self.get_game_results()
+        return self._record_score(results['player1_hands'], results['player1_bets'],
+                                  results['player2_hands'], results['player2_bets'])
+    
+    @staticmethod
+    def _hand_records(player, results, bets):
+        """Résultat, score, mise et cartes de chaque main d'un joueur"""
+        return [{"resultat": status, "score": hand.get_score(), "mise": bet,
+                 "cartes": [list(card) for card in hand.cards]}
+                for hand, (status, _), bet in zip(player.hands, results, bets)]
+    
+    def _record_score(self, results1, bets1, results2, bets2):
+        """Ajoute la manche à l'historique
+        
+        Résultat, score et cartes enregistrés sont ceux de la première main ;
+        après une séparation, chaque main est détaillée (résultat, score,
+        mise, cartes).
+        """
         return self.score_manager.add_score(
             self.player1.name,
-            results['player1'][0],  # Statut (win, lose, draw, blackjack)
-            self.player1.get_score(),
+            results1[0][0],  # Statut (win, lose, draw, blackjack, surrender)
+            self.player1.hands[0].get_score(),
             self.player1.balance,
             self.player2.name,
-            results['player2'][0],
-            self.player2.get_score(),
+            results2[0][0],
+            self.player2.hands[0].get_score(),
             self.player2.balance,
-            self.dealer.get_score()
+            self.dealer.get_score(),
+            cards={
+                "joueur1": self.player1.hands[0].cards,
+                "joueur2": self.player2.hands[0].cards,
+                "croupier": self.dealer.hand
+            },
+            hands={
+                "joueur1": self._hand_records(self.player1, results1, bets1),
+                "joueur2": self._hand_records(self.player2, results2, bets2)
+            }
         )
\ No newline at end of file
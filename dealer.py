@@ -1,65 +1,62 @@
 # Nom : dealer.py
 # Auteur : Arda Tuna Kaya
 # Date : 05.01.2026
-# Version : 2.0
+# Version : 2.1
 # Description : Modèle du croupier Blackjack
+# Changements v2.1 : Calcul de score incrémental via Hand, règle H17/S17 en table
+
+from hand import Hand
+from rules import Rules
+
 
 class Dealer:
     """Classe représentant le croupier"""
     
-    def __init__(self):
-        self.hand = []
-        self.is_busted = False
+    def __init__(self, tables=None):
+        if tables is None:
+            tables = Rules().compile()
+        # dealer_draw[souple][total dur], précalculée selon H17/S17
+        self.draw_table = tables.dealer_draw
+        self.main_hand = Hand()
+    
+    @property
+    def hand(self):
+        """Cartes du croupier"""
+        return self.main_hand.cards
+    
+    @property
+    def is_busted(self):
+        return self.main_hand.is_busted
     
     def add_card(self, card):
         """Ajoute une carte à la main"""
-        self.hand.append(card)
+        self.main_hand.add_card(card)
     
     def get_score(self):
         """Calcule le score de la main avec gestion de l'As"""
-        score = 0
-        aces = 0
-        
-        for card in self.hand:
-            value = card[0]
-            if value in ['J', 'Q', 'K']:
-                score += 10
-            elif value == 'A':
-                aces += 1
-                score += 11
-            else:
-                score += int(value)
-        
-        # Ajustement pour les As
-        while score > 21 and aces > 0:
-            score -= 10
-            aces -= 1
-        
-        return score
+        return self.main_hand.get_score()
     
     def should_draw(self):
-        """Le croupier tire jusqu'à 17"""
-        return self.get_score() < 17
+        """Le croupier tire jusqu'à 17 (et sur 17 souple en H17)"""
+        hand = self.main_hand
+        return self.draw_table[hand.aces > 0][hand.hard_total]
     
     def check_bust(self):
         """Vérifie si le croupier a dépassé 21"""
-        if self.get_score() > 21:
-            self.is_busted = True
-        return self.is_busted
+        return self.main_hand.check_bust()
     
     def has_blackjack(self):
         """Vérifie si le croupier a un Blackjack"""
-        return len(self.hand) == 2 and self.get_score() == 21
+        return self.main_hand.has_blackjack()
     
     def reset_hand(self):
         """Réinitialise la main pour une nouvelle partie"""
-        self.hand = []
-        self.is_busted = False
+        self.main_hand = Hand()
     
     def get_visible_card(self):
         """Retourne la première carte visible"""
-        if len(self.hand) > 0:
-            return self.hand[0]
+        if len(self.main_hand.cards) > 0:
+            return self.main_hand.cards[0]
         return None
     
     def __str__(self):
@@ -0,0 +1,52 @@
+# Nom : events.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Bus d'événements du moteur de jeu (observateurs)
+#
+# Événements émis par BlackjackGame (données passées en arguments nommés) :
+#   round_start    nouvelle manche, avant la distribution
+#   card_dealt     player (Player ou Dealer), card, hidden (carte cachée du croupier)
+#   bust           player (Player ou Dealer)
+#   stand          player
+#   turn_change    player (None : tour du croupier)
+#   settlement     player, results (liste (statut, message) par main),
+#                  bets (mise de chaque main avant règlement)
+#
+# Le moteur n'émet que si `listeners` n'est pas vide : sans abonné
+# (simulation), il tourne à pleine vitesse.
+
+GAME_EVENTS = ("round_start", "card_dealt", "bust", "stand", "turn_change", "settlement")
+ALL = "*"  # Abonnement à tous les événements
+
+
+class EventBus:
+    """Liste d'abonnés par événement"""
+
+    def __init__(self):
+        self.listeners = {}  # événement -> rappels (vide : aucun abonné)
+
+    def subscribe(self, event, callback):
+        """Abonne `callback(event, **données)` à un événement (ou à tous avec "*")
+
+        Returns:
+            callable: Le rappel (utilisable comme décorateur)
+        """
+        self.listeners.setdefault(event, []).append(callback)
+        return callback
+
+    def unsubscribe(self, event, callback):
+        """Désabonne un rappel (sans effet s'il n'est pas abonné)"""
+        listeners = self.listeners.get(event)
+        if listeners and callback in listeners:
+            listeners.remove(callback)
+            if not listeners:
+                del self.listeners[event]
+
+    def emit(self, event, **data):
+        """Appelle les abonnés de l'événement puis ceux de tous les événements"""
+        for key in (event, ALL):
+            listeners = self.listeners.get(key)
+            if listeners:
+                for callback in tuple(listeners):
+                    callback(event, **data)
\ No newline at end of file
@@ -0,0 +1,89 @@
+# Nom : file_lock.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Verrou de fichier consultatif inter-processus (Windows et Unix)
+
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Verrou exclusif posé sur un fichier <chemin>.lock
+
+    Réentrant pour une même instance : un appel imbriqué ne bloque pas.
+    S'utilise avec `with`.
+    """
+
+    def __init__(self, path, timeout=10.0, poll=0.01):
+        """Initialise le verrou
+
+        Args:
+            path (str): Fichier protégé (le verrou est posé sur path + ".lock")
+            timeout (float): Attente maximale en secondes avant abandon
+            poll (float): Intervalle entre deux tentatives
+        """
+        self.lock_path = path + ".lock"
+        self.timeout = timeout
+        self.poll = poll
+        self._fd = None
+        self._depth = 0
+
+    def _try_lock(self, fd):
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self):
+        """Prend le verrou
+
+        Raises:
+            TimeoutError: Si le verrou n'a pas pu être pris à temps
+        """
+        if self._depth:
+            self._depth += 1
+            return
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while not self._try_lock(fd):
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise TimeoutError(f"Verrou occupé: {self.lock_path}")
+            time.sleep(self.poll)
+        self._fd = fd
+        self._depth = 1
+
+    def release(self):
+        """Libère le verrou"""
+        if not self._depth:
+            return
+        self._depth -= 1
+        if self._depth:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
\ No newline at end of file
@@ -2,26 +2,25 @@
 # Auteur : Arda Tuna Kaya
 # Mise à jour : Leonardo Rodrigues
 # Date : 05.01.2026
-# Version : 2.0
+# Version : 2.1
 # Description : Interface graphique du jeu Blackjack avec gestion des scores
 # Changements v2.0 : Intégration ScoreManager, affichage historique, import/export scores
+# Changements v2.1 : Démarrage rapide (PIL, historique et images chargés en arrière-plan),
+#                    table dessinée sur un Canvas unique avec animation de la donne,
+#                    revue des manches enregistrées (voir replay.py),
+#                    soldes repris des comptes des joueurs (voir account_store.py),
+#                    affichage piloté par les événements du jeu (un redessin par rafale)
 
 import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
-from PIL import Image, ImageTk
 from blackjack import BlackjackGame
-
-# -------------------- Paramètres visuels --------------------
-CARD_WIDTH = 130          # Largeur des cartes en pixels
-CARD_SPACING = 8          # Espacement horizontal entre les cartes
-TABLE_BG = "#0b3d0b"      # Couleur du fond (vert foncé)
-PANEL_BG = "#114d14"      # Couleur des panneaux joueurs
-GOLD = "#D4AF37"          # Couleur dorée pour les accents
-TEXT_CLR = "#f4f4f4"      # Couleur du texte principal
-SUBTEXT_CLR = "#cfe8cf"   # Couleur du texte secondaire
-WARN_CLR = "#ffb74d"      # Couleur orange pour les mises
-ACCENT_BLUE = "#6ec6ff"   # Couleur bleue pour les statistiques
+from replay import Replay
+# Paramètres visuels partagés avec le rendu de la table
+from table_canvas import (ACCENT_BLUE, CARD_WIDTH, GOLD, PANEL_BG, SUBTEXT_CLR,
+                          TABLE_BG, TEXT_CLR, TableCanvas)
 
 # Conversion des noms pour les fichiers images
 VALUE_MAP = {
@@ -36,11 +35,31 @@ SUIT_MAP = {
     "♣": "trefle"
 }
 IMAGE_ROOT = "images"  # Dossier contenant les images des cartes
+STARTUP_POLL_MS = 20   # Intervalle de vérification du chargement en arrière-plan
+WARMUP_BATCH = 4       # Images converties pour Tk à chaque pause de la boucle
+DEALER_REVEAL_MS = 700 # Pause entre la fin de la donne du croupier et les résultats
+
+
+def _load_pil_image(path, color):
+    """Ouvre et redimensionne une image de carte (PIL importé à la demande)"""
+    from PIL import Image
+    if os.path.exists(path):
+        img = Image.open(path).convert("RGBA")
+    else:
+        img = Image.new("RGBA", (CARD_WIDTH, int(CARD_WIDTH * 1.45)), color)
+    img.thumbnail((CARD_WIDTH, 10000), Image.LANCZOS)
+    return img
+
+
+def _card_path(value, suit):
+    value_name = VALUE_MAP.get(value, value).lower()
+    suit_name = SUIT_MAP.get(suit, suit).lower()
+    return os.path.join(IMAGE_ROOT, f"{suit_name}-{value_name}.jpg")
 
 
 class BlackjackGUI:
     """Interface graphique du jeu Blackjack avec affichage des cartes en images"""
-    def __init__(self, root):
+    def __init__(self, root, startup_dialogs=True):
         # Configuration de la fenêtre principale
         self.root = root
         self.root.title("Blackjack — Deux Joueurs vs Croupier")
@@ -61,49 +80,113 @@ class BlackjackGUI:
         # Cache pour les images (évite les rechargements)
         self.image_cache = {}
         self.card_back = None
-        self._load_back_image()
+        # Images décodées par le thread de préchargement, en attente de conversion Tk
+        self._decoded = queue.SimpleQueue()
+        self.game = None
+        self.score_manager = None
+        self._loaded_game = None
+        self._load_error = None  # Exception levée par le chargement en arrière-plan
+        self._redraw_pending = None  # Redessin programmé après des événements du jeu
+        self.on_ready = None  # Rappel optionnel une fois le jeu prêt (mesure du démarrage)
+        self.startup_dialogs = startup_dialogs
+
+        # Construction de l'interface : la fenêtre s'affiche avant tout chargement lourd
+        self._build_layout()
+        self.replay_button.config(state=tk.DISABLED)
+        self.scores_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Chargement...")
 
-        # Initialisation du jeu
-        self.game = BlackjackGame()
-        self.game.create_deck()
-        
+        # PIL, l'historique des scores et les images sont chargés en arrière-plan
+        self._loader = threading.Thread(target=self._background_load, daemon=True)
+        self._loader.start()
+        self.root.after(STARTUP_POLL_MS, self._finish_startup)
+
+    # -------------------- Démarrage --------------------
+    def _background_load(self):
+        """Thread d'arrière-plan : jeu, historique et décodage des images (sans Tk)
+
+        Une erreur est conservée dans `_load_error` pour être signalée par
+        `_finish_startup` (le thread ne peut pas toucher à Tk).
+        """
+        try:
+            game = BlackjackGame()
+            game.create_deck()
+            self._loaded_game = game
+            self._decoded.put(("back", _load_pil_image(os.path.join(IMAGE_ROOT, "back.jpg"),
+                                                       (212, 175, 55, 255))))
+            for value in VALUE_MAP:
+                for suit in SUIT_MAP:
+                    self._decoded.put(((value, suit), _load_pil_image(_card_path(value, suit),
+                                                                      (17, 77, 20, 255))))
+        except Exception as e:
+            self._load_error = e
+
+    def _finish_startup(self):
+        """Attend le jeu chargé puis propose l'import et les mises"""
+        if self._load_error is not None and self._loaded_game is None:
+            # Chargement impossible : on l'annonce au lieu d'attendre indéfiniment
+            self.status_label.config(text="Erreur de chargement")
+            messagebox.showerror("Erreur", f"Erreur lors du chargement du jeu: {self._load_error}")
+            return
+        game = self._loaded_game
+        if game is None:
+            self.root.after(STARTUP_POLL_MS, self._finish_startup)
+            return
+
+        self.game = game
+        self.game.events.subscribe("*", self._on_game_event)
         # Gestionnaire des scores - game'den alıyoruz (dublicate'i önlemek için)
         self.score_manager = self.game.score_manager
-        
-        # Proposer l'importation des anciens scores APRÈS l'initialisation du jeu
-        self._propose_import_scores()
-
-        # Construction de l'interface
-        self._build_layout()
-        self.show_betting_screen()
+        self.status_label.config(text="")
+        self.replay_button.config(state=tk.NORMAL)
+        self.scores_button.config(state=tk.NORMAL)
+        self.root.after_idle(self._warm_up_images)
+        if self.on_ready:
+            self.on_ready()
+
+        # Proposer l'importation des anciens scores une fois la table affichée
+        if self.startup_dialogs:
+            self._propose_import_scores()
+            self.show_betting_screen()
+
+    def _warm_up_images(self):
+        """Convertit par petits lots les images décodées en PhotoImage Tk"""
+        from PIL import ImageTk
+        for _ in range(WARMUP_BATCH):
+            try:
+                key, img = self._decoded.get_nowait()
+            except queue.Empty:
+                break
+            if key == "back":
+                if self.card_back is None:
+                    self.card_back = ImageTk.PhotoImage(img)
+            elif key not in self.image_cache:
+                self.image_cache[key] = ImageTk.PhotoImage(img)
+        if not self._decoded.empty() or self._loader.is_alive():
+            self.root.after(STARTUP_POLL_MS, self._warm_up_images)
 
     # -------------------- Chargement des images --------------------
     def _load_back_image(self):
         """Charge l'image du dos de carte (si disponible), sinon crée un placeholder"""
-        path = os.path.join(IMAGE_ROOT, "back.jpg")
-        if os.path.exists(path):
-            img = Image.open(path).convert("RGBA")
-        else:
-            img = Image.new("RGBA", (CARD_WIDTH, int(CARD_WIDTH * 1.45)), (212, 175, 55, 255))
-        img.thumbnail((CARD_WIDTH, 10000), Image.LANCZOS)
+        from PIL import ImageTk
+        img = _load_pil_image(os.path.join(IMAGE_ROOT, "back.jpg"), (212, 175, 55, 255))
         self.card_back = ImageTk.PhotoImage(img)
 
+    def _get_back_image(self):
+        """Retourne l'image du dos de carte (chargée au besoin)"""
+        if self.card_back is None:
+            self._load_back_image()
+        return self.card_back
+
     def _get_card_image(self, value, suit):
         """Retourne l'image correspondante à la carte (value, suit)"""
         key = (value, suit)
         if key in self.image_cache:
             return self.image_cache[key]
 
-        value_name = VALUE_MAP.get(value, value).lower()
-        suit_name = SUIT_MAP.get(suit, suit).lower()
-        path = os.path.join(IMAGE_ROOT, f"{suit_name}-{value_name}.jpg")
-
-        if os.path.exists(path):
-            img = Image.open(path).convert("RGBA")
-        else:
-            img = Image.new("RGBA", (CARD_WIDTH, int(CARD_WIDTH * 1.45)), (17, 77, 20, 255))
-
-        img.thumbnail((CARD_WIDTH, 10000), Image.LANCZOS)
+        # Image pas encore préchargée : décodage immédiat
+        from PIL import ImageTk
+        img = _load_pil_image(_card_path(value, suit), (17, 77, 20, 255))
         tk_img = ImageTk.PhotoImage(img)
         self.image_cache[key] = tk_img
         return tk_img
@@ -114,44 +197,16 @@ class BlackjackGUI:
         self.main = tk.Frame(self.root, bg=TABLE_BG)
         self.main.pack(fill=tk.BOTH, expand=True, padx=18, pady=18)
 
-        # Zone du croupier
-        self.dealer_frame = tk.LabelFrame(self.main, text="Croupier", bg=PANEL_BG, fg=TEXT_CLR,
-                                          font=("Helvetica", 14, "bold"))
-        self.dealer_frame.pack(fill=tk.X, pady=(0, 14))
-        self.dealer_cards_container = tk.Frame(self.dealer_frame, bg=PANEL_BG)
-        self.dealer_cards_container.pack(pady=10)
-        self.dealer_score_label = ttk.Label(self.dealer_frame, text="Score: ?", style="C.TLabel")
-        self.dealer_score_label.pack(pady=(0, 10))
-
-        # Zone des joueurs
-        players_wrap = tk.Frame(self.main, bg=TABLE_BG)
-        players_wrap.pack(fill=tk.BOTH, expand=True)
-
-        # Joueur 1
-        self.p1_frame = tk.LabelFrame(players_wrap, text="Joueur 1", bg=PANEL_BG, fg=TEXT_CLR,
-                                      font=("Helvetica", 14, "bold"))
-        self.p1_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 8))
-        self.p1_cards_container = tk.Frame(self.p1_frame, bg=PANEL_BG)
-        self.p1_cards_container.pack(pady=10)
-        self.p1_score = ttk.Label(self.p1_frame, text="Score: 0", style="C.TLabel")
-        self.p1_score.pack()
-        self.p1_balance = ttk.Label(self.p1_frame, text="Solde: 1000 CHF", style="Small.TLabel")
-        self.p1_balance.pack()
-        self.p1_bet = ttk.Label(self.p1_frame, text="Mise: 0 CHF", style="Small.TLabel", foreground=WARN_CLR)
-        self.p1_bet.pack(pady=(0, 4))
-
-        # Joueur 2
-        self.p2_frame = tk.LabelFrame(players_wrap, text="Joueur 2", bg=PANEL_BG, fg=TEXT_CLR,
-                                      font=("Helvetica", 14, "bold"))
-        self.p2_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(8, 0))
-        self.p2_cards_container = tk.Frame(self.p2_frame, bg=PANEL_BG)
-        self.p2_cards_container.pack(pady=10)
-        self.p2_score = ttk.Label(self.p2_frame, text="Score: 0", style="C.TLabel")
-        self.p2_score.pack()
-        self.p2_balance = ttk.Label(self.p2_frame, text="Solde: 1000 CHF", style="Small.TLabel")
-        self.p2_balance.pack()
-        self.p2_bet = ttk.Label(self.p2_frame, text="Mise: 0 CHF", style="Small.TLabel", foreground=WARN_CLR)
-        self.p2_bet.pack(pady=(0, 4))
+        # Table (croupier et joueurs) : un seul Canvas, cartes en éléments image
+        self.table = TableCanvas(self.main, self._get_card_image, self._get_back_image,
+                                 seats=[("p1", "Joueur 1"), ("p2", "Joueur 2")],
+                                 width=1064, height=540)
+        self.table.pack(fill=tk.BOTH, expand=True)
+        self.table.set_text("dealer", "score", "Score: ?")
+        for key in ("p1", "p2"):
+            self.table.set_text(key, "score", "Score: 0")
+            self.table.set_text(key, "balance", "Solde: 1000 CHF")
+            self.table.set_text(key, "bet", "Mise: 0 CHF")
 
         # Zone de contrôle
         controls = tk.Frame(self.main, bg=TABLE_BG)
@@ -182,6 +237,9 @@ class BlackjackGUI:
 
     def show_betting_screen(self):
         """Affiche la fenêtre pour placer les mises"""
+        # Soldes relus dans les comptes (mouvements des autres tables)
+        self.game.player1.refresh_balance()
+        self.game.player2.refresh_balance()
         bet_w = tk.Toplevel(self.root)
         bet_w.title("Placer vos mises")
         bet_w.configure(bg=TABLE_BG)
@@ -216,7 +274,7 @@ class BlackjackGUI:
                     messagebox.showerror("Erreur", "Joueur 1: Solde insuffisant !")
                     return
                 if not self.game.player2.place_bet(b2):
-                    self.game.player1.balance += b1
+                    self.game.player1.cancel_bet()
                     messagebox.showerror("Erreur", "Joueur 2: Solde insuffisant !")
                     return
                 bet_w.destroy()
@@ -228,17 +286,14 @@ class BlackjackGUI:
 
     def start_game(self):
         """Démarre une nouvelle manche"""
-        self.game.start_new_round()
         self._set_play_buttons(True)
         self.replay_button.config(state=tk.DISABLED)
-        self.update_display()
-        self._update_status()
+        self.game.start_new_round()
 
     def hit(self):
         """Action : tirer une carte"""
         if self.game.current_player:
             result = self.game.hit(self.game.current_player)
-            self.update_display()
             if result in ("bust", "21"):
                 if result == "bust":
                     messagebox.showinfo("Dépassé !", f"{self.game.current_player.name} a dépassé 21 !")
@@ -252,63 +307,50 @@ class BlackjackGUI:
 
     def next_turn(self):
         """Passe au joueur suivant ou au croupier"""
-        has_next = self.game.switch_player()
-        if has_next:
-            self.update_display()
-            self._update_status()
-        else:
+        if not self.game.switch_player():
             self.dealer_turn()
 
     def dealer_turn(self):
-        """Tour du croupier avec animation simple"""
+        """Tour du croupier : les cartes tirées sont animées l'une après l'autre par la table"""
         self._set_play_buttons(False)
+        self.game.dealer_play()
+        self._redraw()
         self.status_label.config(text="Tour du croupier...")
-        self.update_display(show_dealer_card=True)
-        self.root.after(700, self._dealer_draw_animation)
-
-    def _dealer_draw_animation(self):
-        """Animation : le croupier tire ses cartes"""
-        if self.game.dealer.should_draw():
-            self.game.dealer.add_card(self.game.draw_card())
-            self.update_display(show_dealer_card=True)
-            self.root.after(650, self._dealer_draw_animation)
-        else:
-            self.game.dealer.check_bust()
-            self.show_results()
+        self.table.when_idle(self.show_results, DEALER_REVEAL_MS)
+
+    # -------------------- Événements du jeu --------------------
+    def _on_game_event(self, event, **data):
+        """Abonné à tous les événements du jeu : une rafale donne un seul redessin"""
+        if event == "round_start":
+            self.table.clear()
+        if self._redraw_pending is None:
+            self._redraw_pending = self.root.after_idle(self._redraw)
+
+    def _redraw(self):
+        """Redessine la table et le statut après une rafale d'événements"""
+        if self._redraw_pending is not None:
+            self.root.after_cancel(self._redraw_pending)
+            self._redraw_pending = None
+        self.update_display()
+        self._update_status()
 
     # -------------------- Affichage des cartes --------------------
-    def _clear_container(self, container):
-        for w in container.winfo_children():
-            w.destroy()
-
-    def _render_cards(self, container, cards, hide_from_index=None):
-        """Affiche les cartes sous forme d'images"""
-        self._clear_container(container)
-        for idx, (val, suit) in enumerate(cards):
-            img = self.card_back if hide_from_index and idx >= hide_from_index else self._get_card_image(val, suit)
-            lbl = tk.Label(container, image=img, bg=PANEL_BG, bd=0)
-            lbl.image = img
-            lbl.pack(side=tk.LEFT, padx=(0 if idx == 0 else CARD_SPACING), pady=2)
-
     def update_display(self, show_dealer_card=False):
-        """Met à jour l'affichage complet"""
+        """Met à jour l'affichage complet (seuls les éléments modifiés sont redessinés)"""
+        table = self.table
         if show_dealer_card or self.game.game_state in ("dealer_turn", "finished"):
-            self._render_cards(self.dealer_cards_container, self.game.dealer.hand)
-            self.dealer_score_label.config(text=f"Score: {self.game.dealer.get_score()}")
+            table.set_cards("dealer", self.game.dealer.hand)
+            table.set_text("dealer", "score", f"Score: {self.game.dealer.get_score()}")
         else:
             hide_from_index = 1 if len(self.game.dealer.hand) >= 2 else None
-            self._render_cards(self.dealer_cards_container, self.game.dealer.hand, hide_from_index)
-            self.dealer_score_label.config(text="Score: ?")
-
-        self._render_cards(self.p1_cards_container, self.game.player1.hand)
-        self.p1_score.config(text=f"Score: {self.game.player1.get_score()}")
-        self.p1_balance.config(text=f"Solde: {self.game.player1.balance} CHF")
-        self.p1_bet.config(text=f"Mise: {self.game.player1.current_bet} CHF")
+            table.set_cards("dealer", self.game.dealer.hand, hide_from_index)
+            table.set_text("dealer", "score", "Score: ?")
 
-        self._render_cards(self.p2_cards_container, self.game.player2.hand)
-        self.p2_score.config(text=f"Score: {self.game.player2.get_score()}")
-        self.p2_balance.config(text=f"Solde: {self.game.player2.balance} CHF")
-        self.p2_bet.config(text=f"Mise: {self.game.player2.current_bet} CHF")
+        for key, player in (("p1", self.game.player1), ("p2", self.game.player2)):
+            table.set_cards(key, player.hand)
+            table.set_text(key, "score", f"Score: {player.get_score()}")
+            table.set_text(key, "balance", f"Solde: {player.balance} CHF")
+            table.set_text(key, "bet", f"Mise: {player.current_bet} CHF")
 
     def _update_status(self):
         """Met à jour le statut du tour"""
@@ -325,16 +367,20 @@ class BlackjackGUI:
         text = "=== RÉSULTATS ===\n\n"
         text += f"Croupier: {results['dealer_score']} points\n\n"
         for i, player in enumerate([self.game.player1, self.game.player2], start=1):
-            status, msg = results[f"player{i}"]
-            text += f"Joueur {i}: {player.get_score()} points\n"
-            if status == "win":
-                text += f"✓ GAGNÉ ! {msg}\n"
-            elif status == "blackjack":
-                text += f"★ BLACKJACK ! {msg}\n"
-            elif status == "lose":
-                text += f"✗ PERDU ! {msg}\n"
-            else:
-                text += f"= ÉGALITÉ ! {msg}\n"
+            # Une ligne par main (plusieurs après une séparation), score de cette main
+            for number, (hand, (status, msg)) in enumerate(zip(player.hands, results[f"player{i}_hands"]), start=1):
+                label = f"Joueur {i}" if len(player.hands) == 1 else f"Joueur {i} (main {number})"
+                text += f"{label}: {hand.get_score()} points\n"
+                if status == "win":
+                    text += f"✓ GAGNÉ ! {msg}\n"
+                elif status == "blackjack":
+                    text += f"★ BLACKJACK ! {msg}\n"
+                elif status == "lose":
+                    text += f"✗ PERDU ! {msg}\n"
+                elif status == "surrender":
+                    text += f"⚑ ABANDON ! {msg}\n"
+                else:
+                    text += f"= ÉGALITÉ ! {msg}\n"
             text += f"Nouveau solde: {player.balance} CHF\n\n"
         
         # Demander à l'utilisateur s'il veut enregistrer les scores
@@ -355,23 +401,22 @@ class BlackjackGUI:
         """
         if messagebox.askyesno("Importation des scores", 
                                "Souhaitez-vous importer d'anciens scores ?\n(Choisissez un fichier scores.json)"):
-            file_path = filedialog.askopenfilename(
-                title="Sélectionner le fichier scores.json à importer",
+            file_paths = filedialog.askopenfilenames(
+                title="Sélectionner le(s) fichier(s) scores.json à importer",
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
             )
-            if file_path:
-                if self.score_manager.import_scores(file_path):
-                    # Recharger les balances depuis les scores importés
-                    last_balances = self.score_manager.get_last_balances()
-                    self.game.player1.balance = last_balances.get("Joueur 1", 1000)
-                    self.game.player2.balance = last_balances.get("Joueur 2", 1000)
+            if file_paths:
+                # Plusieurs exports : fusion en une seule passe
+                if len(file_paths) == 1:
+                    imported = self.score_manager.import_scores(file_paths[0])
+                else:
+                    imported = self.score_manager.import_many(file_paths)
+                if imported:
+                    # Reprendre les soldes des scores importés (mouvement enregistré dans les comptes)
+                    self.game.restore_balances(self.score_manager.get_last_balances())
                     messagebox.showinfo("Succès", "Les anciens scores ont été importés avec succès !")
                 else:
                     messagebox.showerror("Erreur", "Impossible d'importer le fichier. Format invalide ?")
-        else:
-            # Si l'utilisateur dit "Non", réinitialiser les balances à 1000
-            self.game.player1.balance = 1000
-            self.game.player2.balance = 1000
     
     def show_scores_history(self):
         """Affiche l'historique des scores enregistrés
@@ -379,7 +424,7 @@ class BlackjackGUI:
         Fonctionnalité : Permet à l'utilisateur de consulter tous les scores
         des manches précédentes avec des statistiques détaillées.
         """
-        scores = self.score_manager.get_scores()
+        scores = self.score_manager.get_all_scores()
         
         if not scores:
             messagebox.showinfo("Historique des scores", "Aucun score enregistré pour l'instant.")
@@ -439,7 +484,8 @@ class BlackjackGUI:
                     "win": "✓ Gagné",
                     "lose": "✗ Perdu",
                     "draw": "= Égalité",
-                    "blackjack": "★ Blackjack"
+                    "blackjack": "★ Blackjack",
+                    "surrender": "⚑ Abandon"
                 }
                 return translations.get(result, result)
             
@@ -467,10 +513,12 @@ class BlackjackGUI:
         
         stats_text = f"Statistiques:\n\n"
         stats_text += f"Joueur 1: {stats_p1['victoires']} victoires, {stats_p1['defaites']} défaites, "
-        stats_text += f"{stats_p1['egalites']} égalités, {stats_p1['blackjacks']} blackjacks | "
+        stats_text += f"{stats_p1['egalites']} égalités, {stats_p1['blackjacks']} blackjacks, "
+        stats_text += f"{stats_p1['abandons']} abandons | "
         stats_text += f"Solde: {stats_p1['solde_final']} CHF\n\n"
         stats_text += f"Joueur 2: {stats_p2['victoires']} victoires, {stats_p2['defaites']} défaites, "
-        stats_text += f"{stats_p2['egalites']} égalités, {stats_p2['blackjacks']} blackjacks | "
+        stats_text += f"{stats_p2['egalites']} égalités, {stats_p2['blackjacks']} blackjacks, "
+        stats_text += f"{stats_p2['abandons']} abandons | "
         stats_text += f"Solde: {stats_p2['solde_final']} CHF"
         
         stats_label = ttk.Label(stats_frame, text=stats_text, style="Small.TLabel", justify=tk.LEFT)
@@ -502,6 +550,85 @@ class BlackjackGUI:
                 else:
                     messagebox.showerror("Erreur", "Impossible d'effacer les scores.")
         
+        def replay_scores():
+            """Revoit les manches de l'historique sur la table"""
+            history_window.destroy()
+            self.start_replay(scores)
+        
+        ttk.Button(buttons_frame, text="Revoir les manches", command=replay_scores, style="C.TButton").pack(side=tk.LEFT, padx=5)
         ttk.Button(buttons_frame, text="Exporter les scores", command=export_scores, style="C.TButton").pack(side=tk.LEFT, padx=5)
         ttk.Button(buttons_frame, text="Effacer tous les scores", command=clear_scores, style="C.TButton").pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Fermer", command=history_window.destroy, style="C.TButton").pack(side=tk.LEFT, padx=5)
\ No newline at end of file
+        ttk.Button(buttons_frame, text="Fermer", command=history_window.destroy, style="C.TButton").pack(side=tk.LEFT, padx=5)
+    
+    # -------------------- Revue des manches --------------------
+    def start_replay(self, scores=None, speed=1.0, autoplay=False, on_end=None):
+        """Revoit des manches enregistrées sur la table, pas à pas ou en accéléré
+        
+        Args:
+            scores (list): Manches à revoir (par défaut tout l'historique)
+            speed (float): Vitesse de lecture (1 = rythme d'une partie)
+            autoplay (bool): Lancer la lecture immédiatement
+            on_end (callable): Appelé quand la dernière manche a été affichée
+        """
+        if self.game.game_state in ("playing", "dealer_turn"):
+            messagebox.showinfo("Revue des manches", "Terminez d'abord la manche en cours.")
+            return
+        if scores is None:
+            scores = self.score_manager.get_all_scores()
+        if not scores:
+            messagebox.showinfo("Revue des manches", "Aucun score enregistré pour l'instant.")
+            return
+        
+        def show_round(index, score):
+            self.status_label.config(text=f"Revue : manche {index + 1} / {len(scores)} — {score['timestamp']}")
+        
+        def finished():
+            play_button.config(text="Lecture")
+            if on_end:
+                on_end()
+        
+        replay = Replay(self.table, scores, speed, on_round=show_round, on_end=finished)
+        self.replay_button.config(state=tk.DISABLED)
+        self.scores_button.config(state=tk.DISABLED)
+        
+        # Fenêtre de contrôle de la lecture
+        panel = tk.Toplevel(self.root)
+        panel.title("Revue des manches")
+        panel.configure(bg=TABLE_BG)
+        panel.transient(self.root)
+        
+        def toggle():
+            if replay.playing:
+                replay.pause()
+            else:
+                replay.play()
+            play_button.config(text="Pause" if replay.playing else "Lecture")
+        
+        def close():
+            replay.stop()
+            panel.destroy()
+            self.status_label.config(text="")
+            self.replay_button.config(state=tk.NORMAL)
+            self.scores_button.config(state=tk.NORMAL)
+            if self.game.game_state == "finished":
+                self.update_display(show_dealer_card=True)
+        
+        btns = tk.Frame(panel, bg=TABLE_BG)
+        btns.pack(padx=12, pady=(12, 6))
+        ttk.Button(btns, text="◀ Précédente", command=lambda: replay.step(-1), style="C.TButton").pack(side=tk.LEFT, padx=4)
+        play_button = ttk.Button(btns, text="Lecture", command=toggle, style="C.TButton")
+        play_button.pack(side=tk.LEFT, padx=4)
+        ttk.Button(btns, text="Suivante ▶", command=lambda: replay.step(1), style="C.TButton").pack(side=tk.LEFT, padx=4)
+        ttk.Button(btns, text="Fermer", command=close, style="C.TButton").pack(side=tk.LEFT, padx=4)
+        speed_scale = tk.Scale(panel, from_=0.5, to=200, resolution=0.5, orient=tk.HORIZONTAL, length=360,
+                               label="Vitesse", bg=TABLE_BG, fg=TEXT_CLR, highlightthickness=0,
+                               command=lambda value: replay.set_speed(value))
+        speed_scale.set(speed)
+        speed_scale.pack(padx=12, pady=(0, 12))
+        panel.protocol("WM_DELETE_WINDOW", close)
+        
+        if autoplay:
+            toggle()
+        else:
+            replay.show(0)
+        return replay
\ No newline at end of file
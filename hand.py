@@ -0,0 +1,81 @@
+# Nom : hand.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Main de Blackjack compacte avec calcul de score incrémental
+
+# Valeur de chaque rang (l'As compte 1, le bonus de 10 est ajouté au calcul du score)
+CARD_VALUES = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "10": 10, "J": 10, "Q": 10, "K": 10, "A": 1
+}
+
+
+class Hand:
+    """Main d'un joueur ou du croupier
+
+    Le total « dur » (As = 1) et le nombre d'As sont tenus à jour à chaque
+    carte ajoutée : le score s'obtient donc en temps constant, sans reparcourir
+    les cartes. Les __slots__ gardent chaque main légère, ce qui permet de
+    séparer une main sans multiplier les allocations.
+    """
+
+    __slots__ = ("cards", "bet", "hard_total", "aces", "is_busted",
+                 "is_standing", "is_doubled", "is_split", "is_surrendered")
+
+    def __init__(self, bet=0):
+        self.cards = []
+        self.bet = bet
+        self.hard_total = 0
+        self.aces = 0
+        self.is_busted = False
+        self.is_standing = False
+        self.is_doubled = False
+        self.is_split = False
+        self.is_surrendered = False
+
+    def add_card(self, card):
+        """Ajoute une carte et met à jour le total"""
+        self.cards.append(card)
+        value = CARD_VALUES[card[0]]
+        self.hard_total += value
+        if value == 1:
+            self.aces += 1
+
+    def get_score(self):
+        """Retourne le meilleur score de la main (un As peut valoir 11)"""
+        if self.aces and self.hard_total <= 11:
+            return self.hard_total + 10
+        return self.hard_total
+
+    def is_soft(self):
+        """Vérifie si un As compte actuellement pour 11"""
+        return self.aces > 0 and self.hard_total <= 11
+
+    def check_bust(self):
+        """Vérifie si la main a dépassé 21"""
+        if self.hard_total > 21:
+            self.is_busted = True
+        return self.is_busted
+
+    def has_blackjack(self):
+        """Vérifie si la main est un Blackjack naturel (hors main séparée)"""
+        return (len(self.cards) == 2 and not self.is_split
+                and self.aces == 1 and self.hard_total == 11)
+
+    def can_split(self):
+        """Vérifie si la main peut être séparée (deux cartes de même valeur)"""
+        return (len(self.cards) == 2
+                and CARD_VALUES[self.cards[0][0]] == CARD_VALUES[self.cards[1][0]])
+
+    def pop_card(self):
+        """Retire la dernière carte (utilisé pour séparer une paire)"""
+        card = self.cards.pop()
+        value = CARD_VALUES[card[0]]
+        self.hard_total -= value
+        if value == 1:
+            self.aces -= 1
+        return card
+
+    def __len__(self):
+        return len(self.cards)
\ No newline at end of file
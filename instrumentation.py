@@ -0,0 +1,308 @@
+# Nom : instrumentation.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Mesures optionnelles des chemins critiques (timers, histogrammes, profileur)
+#
+# Désactivée, l'instrumentation ne coûte rien : les méthodes ciblées ne sont
+# enveloppées qu'au moment de enable() et retrouvent leur version d'origine
+# avec disable().
+#
+# Variables d'environnement lues par main.py :
+#   BLACKJACK_METRICS=chemin      export à la fermeture (.prom = texte Prometheus, sinon JSON)
+#   BLACKJACK_METRICS_PORT=port   point d'accès HTTP /metrics au format Prometheus
+#   BLACKJACK_PROFILE=chemin      profileur par échantillonnage (piles repliées)
+
+import functools
+import importlib
+import json
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Méthodes mesurées par défaut : module -> (classe, méthodes, préfixe des métriques)
+DEFAULT_TARGETS = {
+    "blackjack": ("BlackjackGame", ("start_new_round", "hit", "dealer_play"), "game"),
+    "score_manager": ("ScoreManager", ("_save_scores", "_load_scores", "import_scores"), "scores"),
+    "gui": ("BlackjackGUI", ("update_display", "_get_card_image"), "gui"),
+    "table_canvas": ("TableCanvas", ("_frame",), "gui"),
+}
+# Modules d'interface : instrumentés seulement s'ils sont déjà importés
+GUI_MODULES = ("gui", "table_canvas")
+
+# Bornes des seaux en secondes : progression géométrique (x 2^(1/4)) de 1 µs à ~100 s
+BUCKET_BOUNDS = tuple(1e-6 * 2 ** (i / 4) for i in range(108))
+
+
+class Histogram:
+    """Histogramme de durées à seaux logarithmiques (erreur relative < 19 %)"""
+
+    __slots__ = ("name", "counts", "count", "total", "max")
+
+    def __init__(self, name):
+        self.name = name
+        self.counts = array('q', bytes(8 * (len(BUCKET_BOUNDS) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        """Enregistre une durée"""
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """Retourne la borne supérieure du seau contenant le quantile q"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return BUCKET_BOUNDS[idx] if idx < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": self.max
+        }
+
+
+# -------------------- État global --------------------
+_histograms = {}
+_counters = Counter()
+_originals = []   # (objet, attribut, fonction d'origine)
+_server = None
+_profiler = None
+
+
+def is_enabled():
+    """Vérifie si l'instrumentation est active"""
+    return bool(_originals)
+
+
+def histogram(name):
+    """Retourne (en le créant au besoin) l'histogramme `name`"""
+    hist = _histograms.get(name)
+    if hist is None:
+        hist = _histograms[name] = Histogram(name)
+    return hist
+
+
+def increment(name, amount=1):
+    """Incrémente un compteur"""
+    _counters[name] += amount
+
+
+def watch(events):
+    """Compte les événements d'un bus (compteurs events_<nom>)
+
+    Args:
+        events (EventBus): Bus d'événements du jeu
+
+    Returns:
+        callable: L'abonné (à passer à events.unsubscribe("*", ...))
+    """
+    def count(event, **data):
+        _counters[f"events_{event}"] += 1
+    return events.subscribe("*", count)
+
+
+def _wrap(func, hist):
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            hist.observe(perf_counter() - start)
+    return timed
+
+
+def instrument(owner, names, prefix):
+    """Enveloppe des méthodes d'une classe avec un timer
+
+    Args:
+        owner (type): Classe dont les méthodes sont mesurées
+        names (iterable): Noms des méthodes
+        prefix (str): Préfixe des métriques (ex. "game")
+    """
+    for name in names:
+        func = owner.__dict__.get(name)
+        if func is None:
+            continue
+        _originals.append((owner, name, func))
+        setattr(owner, name, _wrap(func, histogram(f"{prefix}_{name.strip('_')}")))
+
+
+def enable(targets=None):
+    """Active les mesures sur les méthodes ciblées
+
+    Les modules d'interface ne sont instrumentés que s'ils sont déjà importés,
+    afin de ne jamais charger Tk et PIL dans une exécution sans interface.
+    La durée de chaque image de la table est mesurée sous gui_frame.
+
+    Args:
+        targets (dict): Cibles (DEFAULT_TARGETS par défaut)
+    """
+    if is_enabled():
+        return
+    for module_name, (class_name, names, prefix) in (targets or DEFAULT_TARGETS).items():
+        if module_name in GUI_MODULES and module_name not in sys.modules:
+            continue
+        module = importlib.import_module(module_name)
+        instrument(getattr(module, class_name), names, prefix)
+
+
+def disable():
+    """Restaure les méthodes d'origine (aucun coût résiduel)"""
+    while _originals:
+        owner, name, func = _originals.pop()
+        setattr(owner, name, func)
+
+
+def reset():
+    """Efface toutes les mesures"""
+    _histograms.clear()
+    _counters.clear()
+
+
+# -------------------- Export --------------------
+def snapshot():
+    """Retourne l'état des mesures sous forme de dictionnaire"""
+    return {
+        "histograms": {name: hist.summary() for name, hist in _histograms.items()},
+        "counters": dict(_counters)
+    }
+
+
+def prometheus_text():
+    """Retourne les mesures au format texte Prometheus (résumés p50/p99)"""
+    lines = []
+    for name, hist in sorted(_histograms.items()):
+        metric = f"blackjack_{name}_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        lines.append(f'{metric}{{quantile="0.5"}} {hist.quantile(0.5):.9f}')
+        lines.append(f'{metric}{{quantile="0.99"}} {hist.quantile(0.99):.9f}')
+        lines.append(f"{metric}_sum {hist.total:.9f}")
+        lines.append(f"{metric}_count {hist.count}")
+    for name, value in sorted(_counters.items()):
+        lines.append(f"# TYPE blackjack_{name}_total counter")
+        lines.append(f"blackjack_{name}_total {value}")
+    return "\n".join(lines) + "\n"
+
+
+def export(path):
+    """Écrit les mesures dans un fichier (.prom : Prometheus, sinon JSON)
+
+    Returns:
+        bool: True si l'écriture a réussi, False sinon
+    """
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith(".prom"):
+                f.write(prometheus_text())
+            else:
+                json.dump(snapshot(), f, indent=2)
+        return True
+    except IOError as e:
+        print(f"Erreur lors de l'export des mesures: {e}")
+        return False
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port=9464, host="127.0.0.1"):
+    """Expose /metrics sur un serveur HTTP local (thread d'arrière-plan)"""
+    global _server
+    if _server is None:
+        _server = HTTPServer((host, port), _MetricsHandler)
+        threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
+
+
+# -------------------- Profileur par échantillonnage --------------------
+class SamplingProfiler:
+    """Échantillonne périodiquement la pile d'un thread (par défaut le thread principal)"""
+
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def dump(self, path):
+        """Écrit les piles au format replié (compatible flamegraph.pl / speedscope)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def start_profiler(interval=0.005):
+    """Démarre le profileur par échantillonnage"""
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler(interval)
+        _profiler.start()
+    return _profiler
+
+
+def stop_profiler(path=None):
+    """Arrête le profileur et écrit éventuellement les piles dans `path`"""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is None:
+        return None
+    profiler.stop()
+    if path:
+        profiler.dump(path)
+    return profiler
\ No newline at end of file
@@ -1,15 +1,86 @@
 # Nom : main.py
 # Auteur : Arda Tuna Kaya
 # Date : 05.01.2026
-# Version : 2.0
+# Version : 2.1
 # Description : Point d'entrée de l'application Blackjack
+# Changements v2.1 : Instrumentation optionnelle (voir instrumentation.py),
+#                    mesure du temps de démarrage (--startup-time),
+#                    événements du jeu comptés avec les mesures
 
+import time
+_START = time.perf_counter()
+
+import atexit
+import os
+import sys
 import tkinter as tk
 from gui import BlackjackGUI
 
+
+def _setup_instrumentation():
+    """Active les mesures si demandé par les variables d'environnement
+
+    Returns:
+        bool: True si les mesures sont actives
+    """
+    metrics_path = os.environ.get("BLACKJACK_METRICS")
+    metrics_port = os.environ.get("BLACKJACK_METRICS_PORT")
+    profile_path = os.environ.get("BLACKJACK_PROFILE")
+    if not (metrics_path or metrics_port or profile_path):
+        return False
+
+    import instrumentation
+    if metrics_path or metrics_port:
+        instrumentation.enable()
+    if metrics_path:
+        atexit.register(instrumentation.export, metrics_path)
+    if metrics_port:
+        instrumentation.serve(int(metrics_port))
+    if profile_path:
+        instrumentation.start_profiler()
+        atexit.register(instrumentation.stop_profiler, profile_path)
+    return bool(metrics_path or metrics_port)
+
+
+def _watch_events(app):
+    """Compte les événements du jeu une fois celui-ci chargé"""
+    import instrumentation
+    app.on_ready = lambda: instrumentation.watch(app.game.events)
+
+
+def _measure_startup(root, app):
+    """Mode --startup-time : affiche le temps jusqu'à la première image et
+    jusqu'au jeu prêt, puis ferme l'application"""
+    def elapsed_ms():
+        return (time.perf_counter() - _START) * 1000
+
+    def first_frame(event):
+        if event.widget is root:
+            root.unbind("<Map>")
+            root.after_idle(lambda: print(f"premiere_image_ms {elapsed_ms():.1f}", file=sys.stderr))
+
+    previous = app.on_ready
+
+    def ready():
+        if previous:
+            previous()
+        print(f"jeu_pret_ms {elapsed_ms():.1f}", file=sys.stderr)
+        root.after_idle(root.destroy)
+
+    root.bind("<Map>", first_frame)
+    app.on_ready = ready
+
+
 def main():
+    metrics = _setup_instrumentation()
+    measure = "--startup-time" in sys.argv[1:]
     root = tk.Tk()
-    app = BlackjackGUI(root)
+    # En mode mesure, pas de dialogues de démarrage qui attendraient l'utilisateur
+    app = BlackjackGUI(root, startup_dialogs=not measure)
+    if metrics:
+        _watch_events(app)
+    if measure:
+        _measure_startup(root, app)
     root.mainloop()
 
 if __name__ == "__main__":
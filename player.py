@@ -1,92 +1,227 @@
 # Nom : player.py
 # Auteur : Arda Tuna Kaya
 # Date : 05.01.2026
-# Version : 2.0
+# Version : 2.1
 # Description : Modèle de joueur Blackjack
+# Changements v2.1 : Mains multiples (séparation), double, assurance et abandon,
+#                    compte persistant optionnel (transactions journalisées),
+#                    solde lu dans le compte (partagé entre tables et places du même nom)
+
+from hand import Hand
 
 
 class Player:
     """Classe représentant un joueur de Blackjack"""
     
-    def __init__(self, name, balance=1000):
+    def __init__(self, name, balance=1000, accounts=None):
+        """Initialise le joueur
+        
+        Args:
+            name (str): Nom du joueur (clé de son compte)
+            balance (float): Solde de départ (si le compte n'existe pas encore)
+            accounts (AccountStore): Comptes persistants ; le solde est celui du
+                compte et chaque mouvement d'argent y est enregistré
+        """
         self.name = name
-        self.balance = balance
-        self.hand = []
-        self.current_bet = 0
+        self.accounts = accounts
+        self.account = accounts.open(name, balance) if accounts is not None else None
+        self._balance = balance
+        self.hands = [Hand()]
+        self.active_hand = 0
+        self.current_bet = 0      # Total misé sur l'ensemble des mains
+        self.insurance_bet = 0
         self.wins = 0
         self.losses = 0
         self.draws = 0
-        self.is_busted = False
-        self.is_standing = False
     
+    # -------------------- Solde --------------------
+    @property
+    def balance(self):
+        """Solde du joueur : celui de son compte s'il en a un
+        
+        Le compte est partagé par toutes les places et tables du même nom :
+        aucune copie locale ne peut s'en écarter.
+        """
+        if self.account is not None:
+            return self.account.balance
+        return self._balance
+    
+    @balance.setter
+    def balance(self, amount):
+        if self.account is not None:
+            self.set_balance(amount)
+        else:
+            self._balance = amount
+    
+    def refresh_balance(self):
+        """Relit le compte (transactions des autres tables) et retourne le solde"""
+        if self.accounts is not None:
+            self.accounts.refresh()
+        return self.balance
+    
+    def _move(self, kind, amount):
+        """Mouvement d'argent : enregistré dans le compte s'il y en a un, sinon
+        appliqué au solde local"""
+        if self.account is not None:
+            self.accounts.record(self.name, kind, amount)
+        else:
+            self._balance += amount
+    
+    def _debit(self, kind, amount):
+        """Débit d'une mise : refusé si le solde ne suffit pas
+        
+        Avec un compte, le solde est vérifié et le débit écrit en une seule
+        opération sous verrou (transactions des autres tables comprises).
+        """
+        if amount <= 0:
+            return False
+        if self.account is not None:
+            return self.accounts.debit(self.name, kind, amount)
+        if amount > self._balance:
+            return False
+        self._balance -= amount
+        return True
+    
+    # -------------------- Main active --------------------
+    @property
+    def current_hand(self):
+        """Main actuellement jouée"""
+        return self.hands[self.active_hand]
+    
+    @property
+    def hand(self):
+        """Cartes de la main active"""
+        return self.hands[self.active_hand].cards
+    
+    @property
+    def is_busted(self):
+        return self.hands[self.active_hand].is_busted
+    
+    @is_busted.setter
+    def is_busted(self, value):
+        self.hands[self.active_hand].is_busted = value
+    
+    @property
+    def is_standing(self):
+        return self.hands[self.active_hand].is_standing
+    
+    @is_standing.setter
+    def is_standing(self, value):
+        self.hands[self.active_hand].is_standing = value
+    
+    def next_hand(self):
+        """Passe à la main suivante après une séparation
+        
+        Returns:
+            bool: True s'il reste une main à jouer, False sinon
+        """
+        if self.active_hand < len(self.hands) - 1:
+            self.active_hand += 1
+            return True
+        return False
+    
+    # -------------------- Mises --------------------
     def place_bet(self, amount):
-        """Place une mise"""
-        if amount <= self.balance and amount > 0:
+        """Place une mise (solde vérifié dans le compte au moment du débit)"""
+        if self._debit("mise", amount):
             self.current_bet = amount
-            self.balance -= amount
+            self.hands[0].bet = amount
             return True
         return False
     
-    def win_bet(self, multiplier=2):
+    def cancel_bet(self):
+        """Annule la mise placée avant le début de la manche"""
+        amount = self.current_bet
+        if amount > 0:
+            self.current_bet = 0
+            self.hands[0].bet = 0
+            self._move("annulation", amount)
+    
+    def set_balance(self, amount):
+        """Fixe le solde (reprise d'un solde importé), écart enregistré dans le compte"""
+        delta = amount - self.balance
+        if delta:
+            self._move("reprise", delta)
+    
+    def add_to_bet(self, hand, amount):
+        """Ajoute une mise supplémentaire sur une main (double, séparation)"""
+        if not self._debit("mise", amount):
+            return False
+        self.current_bet += amount
+        hand.bet += amount
+        return True
+    
+    def _settle(self, hand, payout, kind):
+        """Solde la mise d'une main en créditant le montant payé"""
+        if hand is None:
+            hand = self.hands[self.active_hand]
+        self.current_bet -= hand.bet
+        hand.bet = 0
+        self._move(kind, payout)
+        return payout
+    
+    def win_bet(self, multiplier=2, hand=None):
         """Gagne le pari (multiplie par 2 par défaut)"""
-        winnings = self.current_bet * multiplier
-        self.balance += winnings
+        if hand is None:
+            hand = self.hands[self.active_hand]
         self.wins += 1
-        self.current_bet = 0
-        return winnings
+        return self._settle(hand, hand.bet * multiplier, "gain")
     
-    def lose_bet(self):
+    def lose_bet(self, hand=None):
         """Perd le pari"""
         self.losses += 1
-        self.current_bet = 0
+        self._settle(hand, 0, "perte")
     
-    def draw_bet(self):
+    def draw_bet(self, hand=None):
         """Match nul - récupère la mise"""
-        self.balance += self.current_bet
+        if hand is None:
+            hand = self.hands[self.active_hand]
         self.draws += 1
-        self.current_bet = 0
+        self._settle(hand, hand.bet, "egalite")
     
+    def surrender_bet(self, hand=None):
+        """Abandon - récupère la moitié de la mise"""
+        if hand is None:
+            hand = self.hands[self.active_hand]
+        self.losses += 1
+        return self._settle(hand, hand.bet / 2, "abandon")
+    
+    def place_insurance(self, amount):
+        """Place une assurance (au plus la moitié de la mise initiale)"""
+        if amount > self.hands[0].bet / 2 or not self._debit("assurance", amount):
+            return False
+        self.insurance_bet = amount
+        return True
+    
+    def settle_insurance(self, dealer_has_blackjack):
+        """Solde l'assurance : payée 2:1 si le croupier a un Blackjack"""
+        payout = self.insurance_bet * 3 if dealer_has_blackjack else 0
+        if self.insurance_bet:
+            self._move("assurance", payout)
+        self.insurance_bet = 0
+        return payout
+    
+    # -------------------- Cartes --------------------
     def add_card(self, card):
         """Ajoute une carte à la main"""
-        self.hand.append(card)
+        self.hands[self.active_hand].add_card(card)
     
     def get_score(self):
         """Calcule le score de la main avec gestion de l'As"""
-        score = 0
-        aces = 0
-        
-        for card in self.hand:
-            value = card[0]
-            if value in ['J', 'Q', 'K']:
-                score += 10
-            elif value == 'A':
-                aces += 1
-                score += 11
-            else:
-                score += int(value)
-        
-        # Ajustement pour les As
-        while score > 21 and aces > 0:
-            score -= 10
-            aces -= 1
-        
-        return score
+        return self.hands[self.active_hand].get_score()
     
     def reset_hand(self):
         """Réinitialise la main pour une nouvelle partie"""
-        self.hand = []
-        self.is_busted = False
-        self.is_standing = False
+        self.hands = [Hand(self.current_bet)]
+        self.active_hand = 0
     
     def check_bust(self):
         """Vérifie si le joueur a dépassé 21"""
-        if self.get_score() > 21:
-            self.is_busted = True
-        return self.is_busted
+        return self.hands[self.active_hand].check_bust()
     
     def has_blackjack(self):
         """Vérifie si le joueur a un Blackjack (21 avec 2 cartes)"""
-        return len(self.hand) == 2 and self.get_score() == 21
+        return self.hands[self.active_hand].has_blackjack()
     
     def __str__(self):
         return f"{self.name} - Solde: {self.balance} CHF - Score: {self.get_score()}"
\ No newline at end of file
@@ -0,0 +1,476 @@
+# Nom : replay.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Revue des manches enregistrées (à l'écran ou exportée en images)
+#
+# Utilisation :
+#   python replay.py scores.json --summary planche.png    (planche_001.png, planche_002.png...)
+#   python replay.py scores.json --frames images_manches/ --steps
+#   python replay.py scores.json --gui --vitesse 50      (lecture dans la fenêtre puis fermeture)
+#
+# Les cartes d'une manche ne sont connues que si elles ont été enregistrées
+# avec elle (champ "cartes") ; pour les manches archivées ou plus anciennes,
+# seuls scores, résultats et soldes sont affichés. Après une séparation, les
+# mains d'un joueur sont posées côte à côte dans sa zone (champ "mains").
+#
+# L'export (--frames, --summary) dessine la table avec PIL, sans fenêtre Tk :
+# il fonctionne sans affichage, en intégration continue notamment.
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+from table_canvas import (FRAME_MS, PANEL_BG, PANEL_BORDER, SUBTEXT_CLR, TABLE_BG, TEXT_CLR,
+                          WARN_CLR, card_position, table_layout, text_position)
+
+SEATS = (("p1", "joueur1", "Joueur 1"), ("p2", "joueur2", "Joueur 2"))
+RESULT_LABELS = {
+    "win": "✓ Gagné",
+    "lose": "✗ Perdu",
+    "draw": "= Égalité",
+    "blackjack": "★ Blackjack",
+    "surrender": "⚑ Abandon"
+}
+
+STEP_MS = 450          # Pause entre deux étapes d'une manche à vitesse 1
+ROUND_PAUSE_MS = 1200  # Pause en fin de manche à vitesse 1
+FAST_SPEED = 8         # À partir de cette vitesse : plus d'animation, état final seulement
+EXPORT_SIZE = (1064, 540)
+
+
+# -------------------- Manche enregistrée -> états de la table --------------------
+def seat_hands(score, entry):
+    """Cartes de chaque main d'un joueur (une seule main sans séparation)
+
+    Args:
+        score: Entrée de ScoreManager
+        entry (str): "joueur1" ou "joueur2"
+
+    Returns:
+        list: Cartes de chaque main
+    """
+    hands = score[entry].get("mains")
+    if hands and all("cartes" in hand for hand in hands):
+        return [hand["cartes"] for hand in hands]
+    return [score.get("cartes", {}).get(entry, [])]
+
+
+def _seat_steps(hands):
+    """Étapes d'une place : donne initiale puis cartes tirées, main après main"""
+    if len(hands) == 1:
+        hand = hands[0]
+        return hand[:2], [hand[:count] for count in range(3, len(hand) + 1)]
+    # Paire séparée : la paire d'origine, puis chaque main complétée à la suite
+    steps, done = [], []
+    for hand in hands:
+        for count in range(1, len(hand) + 1):
+            steps.append(done + hand[:count])
+        done = done + hand
+    return [hand[0] for hand in hands[:2]], steps
+
+
+def round_steps(score):
+    """Découpe une manche en étapes d'affichage (donne, cartes tirées, croupier)
+
+    Args:
+        score: Entrée de ScoreManager
+
+    Returns:
+        list: Étapes {clé de zone: (cartes, index de la première carte cachée)} ;
+              une seule étape vide si les cartes n'ont pas été enregistrées
+    """
+    cards = score.get("cartes")
+    if not cards:
+        return [{}]
+    dealer = cards.get("croupier", [])
+    seats = [(key, _seat_steps(seat_hands(score, entry))) for key, entry, _ in SEATS]
+    steps = [{"dealer": (dealer[:2], 1), **{key: (initial, None) for key, (initial, _) in seats}}]
+    for key, (_, seat_steps) in seats:
+        for seat_cards in seat_steps:
+            steps.append({key: (seat_cards, None)})
+    for count in range(2, len(dealer) + 1):
+        steps.append({"dealer": (dealer[:count], None)})
+    return steps
+
+
+def final_state(steps):
+    """État de la table à la fin d'une manche"""
+    state = {}
+    for step in steps:
+        state.update(step)
+    return state
+
+
+def round_texts(score):
+    """Textes de la table pour une manche : {clé de zone: {clé de texte: texte}}"""
+    texts = {"dealer": {"score": f"Score: {score['croupier']['score']}"}}
+    for key, entry, _ in SEATS:
+        player = score[entry]
+        hands = player.get("mains") or [player]
+        texts[key] = {
+            "score": "Score: " + " / ".join(str(hand["score"]) for hand in hands),
+            "balance": f"Solde: {player['solde']} CHF",
+            "bet": " / ".join(RESULT_LABELS.get(hand["resultat"], hand["resultat"]) for hand in hands)
+        }
+    return texts
+
+
+# -------------------- Revue à l'écran --------------------
+class Replay:
+    """Lecture des manches enregistrées sur une TableCanvas
+
+    Pas à pas (step) ou en continu (play) ; la vitesse peut changer pendant la
+    lecture. Au-delà de FAST_SPEED, les manches s'affichent sans animation et,
+    si la cadence dépasse une manche par image, seules certaines sont dessinées.
+    """
+
+    def __init__(self, table, scores, speed=1.0, on_round=None, on_end=None):
+        """Prépare la revue
+
+        Args:
+            table (TableCanvas): Table sur laquelle dessiner
+            scores (list): Manches à revoir
+            speed (float): Vitesse de lecture (1 = rythme d'une partie)
+            on_round (callable): Appelé avec (index, manche) à chaque manche affichée
+            on_end (callable): Appelé quand la lecture atteint la dernière manche
+        """
+        self.table = table
+        self.scores = scores
+        self.speed = speed
+        self.on_round = on_round
+        self.on_end = on_end
+        self.index = -1
+        self.playing = False
+        self._job = None
+        self._generation = 0  # Invalide les étapes en attente d'une manche quittée
+        self._animate = table.animate
+
+    def set_speed(self, speed):
+        self.speed = max(0.1, float(speed))
+
+    def show(self, index):
+        """Affiche la manche `index` (animée si la vitesse le permet)"""
+        self._cancel()
+        self.index = max(0, min(index, len(self.scores) - 1))
+        score = self.scores[self.index]
+        generation = self._generation
+        table = self.table
+        table.clear()
+        for zone_key, texts in round_texts(score).items():
+            for text_key, text in texts.items():
+                table.set_text(zone_key, text_key, text)
+        if self.on_round:
+            self.on_round(self.index, score)
+
+        steps = round_steps(score)
+        if self.speed >= FAST_SPEED:
+            table.animate = False
+            self._apply(final_state(steps))
+            table.render()
+            self._round_done(generation)
+        else:
+            table.animate = self._animate
+            self._play_steps(steps, 0, generation)
+
+    def step(self, delta=1):
+        """Manche suivante (ou précédente si delta < 0), lecture en pause"""
+        self.pause()
+        self.show(self.index + delta)
+
+    def play(self):
+        """Lecture continue à partir de la manche courante"""
+        self.playing = True
+        if self.index < 0 or self.index >= len(self.scores) - 1:
+            self.show(0)
+        else:
+            self._advance()
+
+    def pause(self):
+        self.playing = False
+        self._cancel()
+
+    def stop(self):
+        """Arrête la revue et rend la table dans son état d'origine"""
+        self.pause()
+        self.table.animate = self._animate
+        self.table.clear()
+
+    def _apply(self, state):
+        for zone_key, (cards, hide_from_index) in state.items():
+            self.table.set_cards(zone_key, cards, hide_from_index)
+
+    def _play_steps(self, steps, idx, generation):
+        if generation != self._generation:
+            return
+        self._apply(steps[idx])
+        if idx + 1 < len(steps):
+            self.table.when_idle(lambda: self._play_steps(steps, idx + 1, generation),
+                                 int(STEP_MS / self.speed))
+        else:
+            self.table.when_idle(lambda: self._round_done(generation))
+
+    def _round_done(self, generation):
+        if generation != self._generation or not self.playing:
+            return
+        delay = ROUND_PAUSE_MS / self.speed
+        self._job = self.table.after(max(FRAME_MS, int(delay)), self._advance)
+
+    def _advance(self):
+        self._job = None
+        if self.index >= len(self.scores) - 1:
+            self.playing = False
+            if self.on_end:
+                self.on_end()
+            return
+        # Cadence supérieure à une manche par image : on saute les manches intermédiaires
+        skip = max(1, round(FRAME_MS * self.speed / ROUND_PAUSE_MS)) if self.speed >= FAST_SPEED else 1
+        self.show(self.index + skip)
+
+    def _cancel(self):
+        self._generation += 1
+        if self._job is not None:
+            self.table.after_cancel(self._job)
+            self._job = None
+
+
+# -------------------- Export hors écran (PIL) --------------------
+class _CardImages:
+    """Images PIL des cartes, décodées une fois (mêmes fichiers que l'interface)"""
+
+    def __init__(self):
+        self._cache = {}
+
+    def get(self, card):
+        key = tuple(card) if card is not None else None
+        img = self._cache.get(key)
+        if img is None:
+            from gui import IMAGE_ROOT, _card_path, _load_pil_image
+            if key is None:
+                img = _load_pil_image(os.path.join(IMAGE_ROOT, "back.jpg"), (212, 175, 55, 255))
+            else:
+                img = _load_pil_image(_card_path(*key), (17, 77, 20, 255))
+            self._cache[key] = img
+        return img
+
+
+def _font(size):
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def _draw_text(draw, position, text, font, fill):
+    x, y, anchor = position
+    if anchor == "ne":
+        x -= draw.textlength(text, font=font)
+    elif anchor == "n":
+        x -= draw.textlength(text, font=font) / 2
+    draw.text((x, y), text, font=font, fill=fill)
+
+
+def render_round(score, images=None, size=EXPORT_SIZE, state=None):
+    """Dessine une manche avec PIL, selon la disposition de la TableCanvas
+
+    Args:
+        score: Entrée de ScoreManager
+        images (_CardImages): Cache d'images de cartes (créé si absent)
+        size (tuple): Taille de l'image (largeur, hauteur)
+        state (dict): État à dessiner (par défaut la fin de la manche)
+
+    Returns:
+        PIL.Image.Image: Image de la table
+    """
+    from PIL import Image, ImageDraw
+    images = images or _CardImages()
+    state = final_state(round_steps(score)) if state is None else state
+    texts = round_texts(score)
+    fonts = {"title": _font(18), "score": _font(16), "small": _font(13)}
+    colors = {"score": TEXT_CLR, "balance": SUBTEXT_CLR, "bet": WARN_CLR}
+    titles = {"dealer": "Croupier", **{key: title for key, _, title in SEATS}}
+
+    img = Image.new("RGB", size, TABLE_BG)
+    draw = ImageDraw.Draw(img)
+    for zone_key, box in table_layout(*size, [key for key, _, _ in SEATS]).items():
+        draw.rectangle(box, fill=PANEL_BG, outline=PANEL_BORDER, width=2)
+        draw.text((box[0] + 10, box[1] + 6), titles[zone_key], font=fonts["title"], fill=TEXT_CLR)
+        cards, hide_from_index = state.get(zone_key, ([], None))
+        for idx, card in enumerate(cards):
+            face = None if hide_from_index and idx >= hide_from_index else card
+            card_img = images.get(face)
+            img.paste(card_img, card_position(zone_key, box, idx, len(cards)), card_img)
+        for line, (text_key, text) in enumerate(texts[zone_key].items()):
+            font = fonts["score"] if text_key == "score" else fonts["small"]
+            _draw_text(draw, text_position(box, text_key, line - 1), text, font, colors[text_key])
+    return img
+
+
+def export_frames(scores, directory, steps=False):
+    """Écrit une image PNG par manche (ou par étape de manche)
+
+    Args:
+        scores (list): Manches à exporter
+        directory (str): Dossier de destination (créé si besoin)
+        steps (bool): Une image par étape (donne, cartes tirées...) au lieu de l'état final
+
+    Returns:
+        int: Nombre d'images écrites
+    """
+    os.makedirs(directory, exist_ok=True)
+    images = _CardImages()
+    written = 0
+    for number, score in enumerate(scores, start=1):
+        if steps:
+            state = {}
+            for step_number, step in enumerate(round_steps(score), start=1):
+                state.update(step)
+                render_round(score, images, state=state).save(
+                    os.path.join(directory, f"manche_{number:05d}_{step_number:02d}.png"))
+                written += 1
+        else:
+            render_round(score, images).save(os.path.join(directory, f"manche_{number:05d}.png"))
+            written += 1
+    return written
+
+
+def summary_stats(scores):
+    """Résultats par joueur et derniers soldes sur un ensemble de manches"""
+    stats = {}
+    for score in scores:
+        for _, entry, _ in SEATS:
+            player = score[entry]
+            player_stats = stats.setdefault(player["nom"], {"resultats": Counter(), "solde": None})
+            player_stats["resultats"][player["resultat"]] += 1
+            player_stats["solde"] = player["solde"]
+    return stats
+
+
+def summary_pages(path, pages):
+    """Noms des pages d'une planche : planche.png -> planche_001.png, planche_002.png..."""
+    root, ext = os.path.splitext(path)
+    return [f"{root}_{number:03d}{ext or '.png'}" for number in range(1, pages + 1)]
+
+
+def export_summary(scores, path, columns=6, thumb_width=320, rows_per_page=20):
+    """Écrit une planche récapitulative : statistiques puis une vignette par manche
+
+    La planche est découpée en pages de `rows_per_page` lignes de vignettes
+    (planche_001.png, planche_002.png...) : la mémoire utilisée ne dépend pas du
+    nombre de manches. Chaque page reprend les statistiques de l'ensemble.
+
+    Args:
+        scores (list): Manches à résumer
+        path (str): Nom de la planche (PNG), complété par le numéro de page
+        columns (int): Nombre de vignettes par ligne
+        thumb_width (int): Largeur d'une vignette en pixels
+        rows_per_page (int): Lignes de vignettes par page
+
+    Returns:
+        list: Fichiers écrits (vide en cas d'erreur)
+    """
+    from PIL import Image, ImageDraw
+    thumb_height = round(thumb_width * EXPORT_SIZE[1] / EXPORT_SIZE[0])
+    caption_height = 20
+    margin = 12
+    stats = summary_stats(scores)
+    header_height = 40 + 22 * len(stats)
+    per_page = columns * max(1, rows_per_page)
+    paths = summary_pages(path, max(1, (len(scores) + per_page - 1) // per_page))
+    title_font, text_font = _font(20), _font(13)
+    images = _CardImages()
+
+    for page, page_path in enumerate(paths):
+        first = page * per_page
+        page_scores = scores[first:first + per_page]
+        rows = (len(page_scores) + columns - 1) // columns
+        sheet = Image.new("RGB", (margin + columns * (thumb_width + margin),
+                                  header_height + rows * (thumb_height + caption_height + margin) + margin),
+                          TABLE_BG)
+        draw = ImageDraw.Draw(sheet)
+
+        title = f"{len(scores)} manches"
+        if len(paths) > 1:
+            title += f" — page {page + 1}/{len(paths)} (manches {first + 1} à {first + len(page_scores)})"
+        draw.text((margin, margin), title, font=title_font, fill=TEXT_CLR)
+        y = 40
+        for name, player_stats in stats.items():
+            counts = ", ".join(f"{RESULT_LABELS.get(result, result)}: {n}"
+                               for result, n in sorted(player_stats["resultats"].items()))
+            draw.text((margin, y), f"{name} — {counts} | Solde: {player_stats['solde']} CHF",
+                      font=text_font, fill=SUBTEXT_CLR)
+            y += 22
+
+        for idx, score in enumerate(page_scores):
+            row, column = divmod(idx, columns)
+            x = margin + column * (thumb_width + margin)
+            y = header_height + row * (thumb_height + caption_height + margin)
+            thumb = render_round(score, images).resize((thumb_width, thumb_height), Image.BILINEAR)
+            sheet.paste(thumb, (x, y))
+            draw.text((x, y + thumb_height + 3), f"#{first + idx + 1}  {score['timestamp']}",
+                      font=text_font, fill=TEXT_CLR)
+        try:
+            sheet.save(page_path)
+        except IOError as e:
+            print(f"Erreur lors de l'export de la planche: {e}")
+            return []
+    return paths
+
+
+# -------------------- Ligne de commande --------------------
+def _play_in_window(scores, speed):
+    """Lit les manches dans la fenêtre du jeu puis la ferme (affichage requis)"""
+    import tkinter as tk
+    from gui import BlackjackGUI
+
+    root = tk.Tk()
+    app = BlackjackGUI(root, startup_dialogs=False)
+    app.on_ready = lambda: app.start_replay(scores, speed, autoplay=True, on_end=root.destroy)
+    root.mainloop()
+    return app.table.frame_stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Revue des manches enregistrées")
+    parser.add_argument("scores", nargs="?", default="scores.json", help="fichier de scores")
+    parser.add_argument("--frames", help="dossier : une image par manche")
+    parser.add_argument("--steps", action="store_true", help="avec --frames : une image par étape")
+    parser.add_argument("--summary", help="planche récapitulative (PNG, numérotée par page)")
+    parser.add_argument("--columns", type=int, default=6, help="vignettes par ligne de la planche")
+    parser.add_argument("--rows", type=int, default=20, help="lignes de vignettes par page de la planche")
+    parser.add_argument("--limit", type=int, default=None, help="seulement les N dernières manches")
+    parser.add_argument("--gui", action="store_true", help="lecture dans la fenêtre du jeu")
+    parser.add_argument("--vitesse", type=float, default=20.0, help="vitesse de lecture avec --gui")
+    args = parser.parse_args(argv)
+
+    from score_manager import ScoreManager
+    scores = ScoreManager(args.scores).get_all_scores()
+    if args.limit:
+        scores = scores[-args.limit:]
+    if not scores:
+        print("Aucune manche à revoir.", file=sys.stderr)
+        return 1
+
+    report = {"manches": len(scores)}
+    try:
+        if args.frames:
+            report["images"] = export_frames(scores, args.frames, args.steps)
+        if args.summary:
+            pages = export_summary(scores, args.summary, args.columns, rows_per_page=args.rows)
+            if not pages:
+                return 1
+            report["planche"] = pages
+    except ImportError as e:  # PIL absent
+        print(f"Erreur lors de l'export des images: {e}", file=sys.stderr)
+        return 1
+    if args.gui:
+        report["images_ecran"] = _play_in_window(scores, args.vitesse)
+    print(json.dumps(report, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,133 @@
+# Nom : rules.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Configuration des règles de la table et tables de décision précalculées
+
+SUITS = ['♠', '♥', '♦', '♣']
+VALUES = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+# Taille des tables indexées par total « dur » (As = 1)
+MAX_TOTAL = 40
+
+
+def hand_max_cards(decks):
+    """Cartes au plus dans une main : les plus petites cartes du sabot jusqu'au dépassement
+
+    Avec un paquet, 21 est atteint avec quatre As, quatre 2 et trois 3 : la
+    douzième carte dépasse. Avec plus de paquets, la main compte plus de petites
+    cartes (jusqu'à 21 As puis une carte de plus à partir de six paquets).
+
+    Args:
+        decks (int): Nombre de paquets dans le sabot
+
+    Returns:
+        int: Nombre maximal de cartes d'une main, carte du dépassement comprise
+    """
+    total = cards = 0
+    for value in range(1, 10):  # As compté 1, puis 2 à 9 (quatre par paquet)
+        for _ in range(4 * decks):
+            total += value
+            cards += 1
+            if total > 21:
+                return cards
+    return cards + 1  # Inatteignable : 21 est dépassé avant les figures
+
+
+class Rules:
+    """Règles configurables d'une table de Blackjack
+
+    Les valeurs par défaut reproduisent le comportement historique du jeu :
+    un paquet, le croupier reste sur tous les 17, Blackjack payé 3:2.
+    """
+
+    def __init__(self, dealer_hits_soft_17=False, blackjack_payout=1.5, decks=1,
+                 penetration=0.6, double_totals=None, double_after_split=True,
+                 max_hands=4, resplit_aces=False, surrender=True, insurance=True):
+        """Initialise les règles
+
+        Args:
+            dealer_hits_soft_17 (bool): Le croupier tire sur un 17 souple (H17)
+            blackjack_payout (float): Gain d'un Blackjack naturel (1.5 = 3:2, 1.2 = 6:5)
+            decks (int): Nombre de paquets dans le sabot
+            penetration (float): Part du sabot distribuée avant de remélanger
+            double_totals (iterable): Totaux autorisés pour doubler (None = tous)
+            double_after_split (bool): Doubler est permis après une séparation
+            max_hands (int): Nombre maximal de mains après séparations
+            resplit_aces (bool): Des As séparés peuvent être re-séparés
+            surrender (bool): Abandon tardif autorisé
+            insurance (bool): Assurance proposée sur un As du croupier
+
+        Raises:
+            ValueError: Si decks ou max_hands est inférieur à 1, ou si
+                penetration n'est pas strictement comprise entre 0 et 1
+        """
+        if not 0 < penetration < 1:
+            raise ValueError(f"Pénétration invalide (0 < p < 1): {penetration}")
+        if decks < 1:
+            raise ValueError(f"Nombre de paquets invalide (au moins 1): {decks}")
+        if max_hands < 1:
+            raise ValueError(f"Nombre de mains invalide (au moins 1): {max_hands}")
+        self.dealer_hits_soft_17 = dealer_hits_soft_17
+        self.blackjack_payout = blackjack_payout
+        self.decks = decks
+        self.penetration = penetration
+        # Ensemble figé : consulté une fois par total lors de la compilation
+        # (un générateur serait épuisé dès le premier total)
+        self.double_totals = frozenset(double_totals) if double_totals is not None else None
+        self.double_after_split = double_after_split
+        self.max_hands = max_hands
+        self.resplit_aces = resplit_aces
+        self.surrender = surrender
+        self.insurance = insurance
+
+    def compile(self):
+        """Précalcule les tables de décision consultées à chaque main
+
+        Returns:
+            RuleTables: Tables prêtes à l'emploi pour Dealer et BlackjackGame
+        """
+        return RuleTables(self)
+
+
+class RuleTables:
+    """Règles compilées en tables de consultation (aucun calcul par main)"""
+
+    __slots__ = ("rules", "dealer_draw", "can_double", "natural_multiplier",
+                 "shoe", "reshuffle_at", "emergency_reshuffle", "max_hands",
+                 "double_after_split", "resplit_aces", "surrender", "insurance")
+
+    def __init__(self, rules):
+        self.rules = rules
+
+        # dealer_draw[souple][total dur] : le croupier doit-il tirer ?
+        hard, soft = [], []
+        for total in range(MAX_TOTAL):
+            hard.append(total < 17)
+            score = total + 10 if total <= 11 else total
+            is_soft = total <= 11
+            soft.append(score < 17 or (score == 17 and is_soft and rules.dealer_hits_soft_17))
+        self.dealer_draw = (tuple(hard), tuple(soft))
+
+        # can_double[score] : doubler autorisé pour ce score
+        allowed = rules.double_totals
+        self.can_double = tuple(allowed is None or score in allowed for score in range(MAX_TOTAL))
+
+        # Gain total (mise comprise) d'un Blackjack naturel
+        self.natural_multiplier = 1 + rules.blackjack_payout
+
+        # Sabot ordonné, copié puis mélangé à chaque création du paquet
+        self.shoe = tuple((value, suit) for _ in range(rules.decks)
+                          for suit in SUITS for value in VALUES)
+        # Mélange d'urgence en cours de manche quand il reste moins d'une main
+        # complète ; une manche commence toujours au-dessus de ce seuil
+        self.emergency_reshuffle = max(int(len(self.shoe) * (1 - rules.penetration)) // 2,
+                                       hand_max_cards(rules.decks))
+        self.reshuffle_at = max(int(len(self.shoe) * (1 - rules.penetration)),
+                                self.emergency_reshuffle)
+
+        self.max_hands = rules.max_hands
+        self.double_after_split = rules.double_after_split
+        self.resplit_aces = rules.resplit_aces
+        self.surrender = rules.surrender
+        self.insurance = rules.insurance
\ No newline at end of file
@@ -0,0 +1,278 @@
+# Nom : score_archive.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Archive en colonnes compressées pour l'historique des scores
+#
+# Format d'un fichier d'archive : une suite de segments indépendants
+#   MAGIC (4 octets) | version (1) | taille de l'en-tête (4, little-endian)
+#   | en-tête JSON | colonnes compressées (zlib), les unes après les autres
+#
+# Colonnes d'un segment :
+#   id            identifiants séparés par "\n"
+#   timestamp     millisecondes, encodées en différences successives (int64)
+#   nom1, nom2    index dans le dictionnaire des noms (uint16)
+#   res1, res2    index dans le dictionnaire des résultats (uint8)
+#   score1, score2, croupier   scores (uint8)
+#   solde1, solde2             soldes en centimes (int64)
+#
+# La lecture passe par mmap : seules les colonnes nécessaires à une requête
+# sont décompressées (les statistiques d'un joueur ignorent id, dates et scores).
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime, timedelta
+
+MAGIC = b"BJSA"
+VERSION = 1
+_PREFIX = struct.Struct("<4sBI")
+EPOCH = datetime(1970, 1, 1)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# Colonnes numériques : nom -> code de type array
+NUMERIC_COLUMNS = {
+    "timestamp": "q",
+    "nom1": "H", "nom2": "H",
+    "res1": "B", "res2": "B",
+    "score1": "B", "score2": "B", "croupier": "B",
+    "solde1": "q", "solde2": "q",
+}
+
+
+def _to_millis(timestamp):
+    """Convertit un horodatage texte en millisecondes depuis 1970"""
+    try:
+        moment = datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    except ValueError:
+        moment = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+    return (moment - EPOCH) // timedelta(milliseconds=1)
+
+
+def _from_millis(millis):
+    return (EPOCH + timedelta(milliseconds=millis)).strftime(TIMESTAMP_FORMAT)[:-3]
+
+
+def _to_cents(balance):
+    return int(round(balance * 100))
+
+
+def _from_cents(cents):
+    return cents // 100 if cents % 100 == 0 else cents / 100
+
+
+def _id_text(score):
+    """Identifiant de la manche en texte (absent ou None : chaîne vide)"""
+    score_id = score.get("id")
+    return "" if score_id is None else str(score_id)
+
+
+def _pack(values, typecode):
+    data = array(typecode, values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _unpack(raw, typecode):
+    data = array(typecode)
+    data.frombytes(raw)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+
+def write_segment(path, scores, level=9):
+    """Ajoute un segment contenant `scores` à la fin d'une archive
+
+    Args:
+        path (str): Chemin du fichier d'archive (créé si besoin)
+        scores (list): Entrées au format de ScoreManager
+        level (int): Niveau de compression zlib
+
+    Returns:
+        int: Nombre de manches archivées
+    """
+    if not scores:
+        return 0
+    names, results = {}, {}
+    columns = {name: [] for name in NUMERIC_COLUMNS}
+    ids = []
+    previous = 0
+    for score in scores:
+        ids.append(_id_text(score))
+        millis = _to_millis(score["timestamp"])
+        columns["timestamp"].append(millis - previous)
+        previous = millis
+        for suffix, key in (("1", "joueur1"), ("2", "joueur2")):
+            player = score[key]
+            columns["nom" + suffix].append(names.setdefault(player["nom"], len(names)))
+            columns["res" + suffix].append(results.setdefault(player["resultat"], len(results)))
+            columns["score" + suffix].append(player["score"])
+            columns["solde" + suffix].append(_to_cents(player["solde"]))
+        columns["croupier"].append(score["croupier"]["score"])
+
+    blobs = [("id", zlib.compress("\n".join(ids).encode("utf-8"), level))]
+    for name, typecode in NUMERIC_COLUMNS.items():
+        blobs.append((name, zlib.compress(_pack(columns[name], typecode), level)))
+
+    layout, offset = {}, 0
+    for name, blob in blobs:
+        layout[name] = [offset, len(blob)]
+        offset += len(blob)
+    header = json.dumps({
+        "count": len(scores),
+        "names": list(names),
+        "results": list(results),
+        "columns": layout
+    }, ensure_ascii=False).encode("utf-8")
+
+    with open(path, "ab") as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for _, blob in blobs:
+            f.write(blob)
+    return len(scores)
+
+
+class ArchiveSegment:
+    """Segment d'archive lu à travers mmap, colonnes décompressées à la demande"""
+
+    def __init__(self, buffer, start, header, data_start):
+        self._buffer = buffer
+        self.start = start
+        self.count = header["count"]
+        self.names = header["names"]
+        self.results = header["results"]
+        self._layout = header["columns"]
+        self._data_start = data_start
+        self._columns = {}
+
+    def column(self, name):
+        """Retourne une colonne décompressée (mise en cache)"""
+        cached = self._columns.get(name)
+        if cached is not None:
+            return cached
+        offset, length = self._layout[name]
+        begin = self._data_start + offset
+        raw = zlib.decompress(self._buffer[begin:begin + length])
+        if name == "id":
+            value = raw.decode("utf-8").split("\n") if self.count else []
+        else:
+            value = _unpack(raw, NUMERIC_COLUMNS[name])
+            if name == "timestamp":
+                total = 0
+                for idx, delta in enumerate(value):
+                    total += delta
+                    value[idx] = total
+        self._columns[name] = value
+        return value
+
+    def record(self, idx):
+        """Reconstruit l'entrée `idx` au format de ScoreManager"""
+        column = self.column
+        entry = {"id": column("id")[idx], "timestamp": _from_millis(column("timestamp")[idx])}
+        for suffix, key in (("1", "joueur1"), ("2", "joueur2")):
+            entry[key] = {
+                "nom": self.names[column("nom" + suffix)[idx]],
+                "resultat": self.results[column("res" + suffix)[idx]],
+                "score": column("score" + suffix)[idx],
+                "solde": _from_cents(column("solde" + suffix)[idx])
+            }
+        entry["croupier"] = {"score": column("croupier")[idx]}
+        return entry
+
+
+class ScoreArchive:
+    """Archive de scores en lecture, projetée en mémoire"""
+
+    def __init__(self, path):
+        """Ouvre une archive existante
+
+        Args:
+            path (str): Chemin du fichier d'archive
+
+        Raises:
+            ValueError: Si le fichier n'est pas une archive valide
+        """
+        self.path = path
+        self.segments = []
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        position = 0
+        while position < size:
+            magic, version, header_len = _PREFIX.unpack_from(self._buffer, position)
+            if magic != MAGIC or version != VERSION:
+                self.close()
+                raise ValueError(f"Archive invalide: {path}")
+            header_start = position + _PREFIX.size
+            header = json.loads(bytes(self._buffer[header_start:header_start + header_len]))
+            data_start = header_start + header_len
+            self.segments.append(ArchiveSegment(self._buffer, position, header, data_start))
+            position = data_start + sum(length for _, length in header["columns"].values())
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def __len__(self):
+        return sum(segment.count for segment in self.segments)
+
+    def __iter__(self):
+        """Parcourt les entrées archivées, de la plus ancienne à la plus récente"""
+        for segment in self.segments:
+            for idx in range(segment.count):
+                yield segment.record(idx)
+
+    def ids(self):
+        """Ensemble des identifiants archivés"""
+        found = set()
+        for segment in self.segments:
+            found.update(segment.column("id"))
+        return found
+
+    def player_stats(self, player_name):
+        """Compte les résultats d'un joueur sans décompresser dates, scores ni identifiants
+
+        Returns:
+            dict: {"win": n, "lose": n, "draw": n, "blackjack": n, ...}, dernier solde ou None
+        """
+        counts = {}
+        final_balance = None
+        for segment in self.segments:
+            if player_name not in segment.names:
+                continue
+            name_idx = segment.names.index(player_name)
+            per_result = [0] * len(segment.results)
+            for suffix in ("1", "2"):
+                names = segment.column("nom" + suffix)
+                results = segment.column("res" + suffix)
+                for idx in range(segment.count):
+                    if names[idx] == name_idx:
+                        per_result[results[idx]] += 1
+            for result_idx, n in enumerate(per_result):
+                result = segment.results[result_idx]
+                counts[result] = counts.get(result, 0) + n
+            # Dernier solde : on part de la fin du segment
+            names1, names2 = segment.column("nom1"), segment.column("nom2")
+            for idx in range(segment.count - 1, -1, -1):
+                if names2[idx] == name_idx:
+                    final_balance = _from_cents(segment.column("solde2")[idx])
+                    break
+                if names1[idx] == name_idx:
+                    final_balance = _from_cents(segment.column("solde1")[idx])
+                    break
+        return counts, final_balance
+
+    def last_record(self):
+        """Dernière entrée archivée (ou None)"""
+        for segment in reversed(self.segments):
+            if segment.count:
+                return segment.record(segment.count - 1)
+        return None
\ No newline at end of file
@@ -2,54 +2,238 @@
 # Auteur : Arda Tuna Kaya
 # Auteur 2 : Leonardo Rodrigues
 # Date : 17.12.2025
-# Version : 2.0
+# Version : 2.1
 # Description : Gestion de l'enregistrement et de l'importation des scores
 # Changements v2.0 : Ajout UUID pour unicité des scores, import anti-duplicates
+# Changements v2.1 : Archivage des anciennes manches en colonnes compressées,
+#                    mode lecture seule sur fichier d'enregistrements projeté en mémoire,
+#                    écriture groupée (group commit), lecture validée et JSON accéléré,
+#                    verrou inter-processus avec relecture et fusion avant écriture,
+#                    cartes de la manche enregistrées (optionnel, pour la revue),
+#                    détail des mains séparées (résultat, score, mise),
+#                    derniers soldes indexés par nom de joueur
 
+import atexit
 import json
 import os
+import threading
 import uuid
 from datetime import datetime
+from file_lock import FileLock
+from score_archive import ScoreArchive, write_segment
+from score_merge import dedup_key, merge_score_files
+from score_records import ScoreRecordFile, write_records
+from score_schema import SchemaError, decode_scores, dumps
 
 
 class ScoreManager:
     """Classe pour gérer l'enregistrement et l'importation des scores"""
     
-    def __init__(self, filename="scores.json"):
+    def __init__(self, filename="scores.json", archive_file=None, readonly=False,
+                 batch_size=1, flush_interval=None, sync=False):
         """Initialise le gestionnaire de scores
         
         Args:
             filename (str): Nom du fichier JSON contenant les scores
+            archive_file (str): Archive des anciennes manches (par défaut <nom>.bjarc)
+            readonly (bool): Ouvre `filename` comme fichier d'enregistrements binaire
+                (voir export_records) projeté en mémoire, en lecture seule
+            batch_size (int): Nombre de manches regroupées par écriture (1 = chaque manche)
+            flush_interval (float): Délai maximal en secondes avant l'écriture des
+                manches en attente (None = pas de limite de temps)
+            sync (bool): Écriture durable (fichier temporaire, fsync puis remplacement)
         """
         self.filename = filename
+        self.archive_file = archive_file or os.path.splitext(filename)[0] + ".bjarc"
+        self.readonly = readonly
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.sync = sync
         self.scores = []
-        self._load_scores()
+        self._archive = None
+        # Entrées invalides écartées au dernier chargement / import
+        self.quarantine_file = os.path.splitext(filename)[0] + ".quarantine.json"
+        self.rejected = 0
+        # Manches ajoutées à self.scores mais pas encore écrites sur disque
+        self._pending = 0
+        self._lock = threading.RLock()
+        self._timer = None
+        # Plusieurs processus peuvent partager le fichier : verrou consultatif,
+        # et manches déjà vues pour distinguer ajouts étrangers et suppressions locales
+        self._file_lock = FileLock(filename)
+        self._known = set()
+        self._stamp = None
+        if self.batch_size > 1 or flush_interval:
+            atexit.register(self.flush)
+        if readonly:
+            # Les enregistrements ne sont décodés qu'à l'accès
+            self.scores = ScoreRecordFile(filename)
+        else:
+            self._load_scores()
+    
+    def _get_archive(self):
+        """Ouvre l'archive à la première utilisation (None si absente ou illisible)
+        
+        En lecture seule, le fichier d'enregistrements contient déjà les
+        manches archivées (voir export_records) : l'archive n'est pas lue.
+        """
+        if self.readonly:
+            return None
+        if self._archive is None and os.path.exists(self.archive_file):
+            try:
+                self._archive = ScoreArchive(self.archive_file)
+            except (ValueError, IOError) as e:
+                print(f"Erreur lors de la lecture de l'archive: {e}")
+        return self._archive
+    
+    def _close_archive(self):
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
     
     def _load_scores(self):
-        """Charge les scores depuis le fichier JSON si disponible"""
+        """Charge les scores depuis le fichier JSON si disponible
+        
+        Les entrées non conformes au schéma sont mises en quarantaine
+        plutôt que chargées.
+        """
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    self.scores = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(self.filename, 'rb') as f:
+                    stamp = self._stat_stamp(os.fstat(f.fileno()))
+                    self.scores, rejected = decode_scores(f.read())
+                self._quarantine(rejected)
+                self._stamp = stamp
+            except (SchemaError, IOError):
                 # Si le fichier est corrompu, on repart avec une liste vide
                 self.scores = []
         else:
             self.scores = []
+        self._known = {dedup_key(score) for score in self.scores}
+    
+    @staticmethod
+    def _stat_stamp(stat):
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _merge_foreign(self):
+        """Relit le fichier et reporte en mémoire les écritures des autres processus
+        
+        À appeler sous verrou. Une manche du fichier inconnue de ce gestionnaire
+        est ajoutée ; une manche déjà vue mais absente du fichier a été
+        supprimée ailleurs (effacement, archivage) et est retirée. Une manche
+        déjà vue et absente de la mémoire a été supprimée localement : elle
+        n'est pas reprise. Rien n'est relu si le fichier n'a pas changé depuis
+        la dernière lecture ou écriture.
+        """
+        try:
+            stamp = self._stat_stamp(os.stat(self.filename))
+        except OSError:
+            return
+        if stamp == self._stamp:
+            return
+        try:
+            with open(self.filename, 'rb') as f:
+                on_disk, _ = decode_scores(f.read())
+        except (SchemaError, IOError):
+            return
+        disk_keys = {dedup_key(score) for score in on_disk}
+        removed = self._known - disk_keys
+        if removed:
+            self.scores = [score for score in self.scores if dedup_key(score) not in removed]
+        local = {dedup_key(score) for score in self.scores}
+        foreign = []
+        for score in on_disk:
+            key = dedup_key(score)
+            if key not in self._known and key not in local:
+                foreign.append(score)
+        if foreign:
+            self.scores.extend(foreign)
+            self.scores.sort(key=lambda score: score.get("timestamp") or "")
+    
+    @staticmethod
+    def _quarantine_key(rejected_entry):
+        """Clé de doublon d'une entrée rejetée (qui n'est pas forcément un objet)"""
+        entry = rejected_entry.get("entree")
+        if isinstance(entry, dict) and isinstance(entry.get("id"), str):
+            return dedup_key(entry)
+        return json.dumps(entry, sort_keys=True, ensure_ascii=False, default=str)
+    
+    def _quarantine(self, rejected):
+        """Ajoute des entrées invalides au fichier de quarantaine
+        
+        Une entrée déjà en quarantaine n'est pas ajoutée une seconde fois
+        (elle reste dans scores.json jusqu'à la prochaine écriture et serait
+        sinon rejetée à chaque chargement).
+        """
+        self.rejected = len(rejected)
+        if not rejected:
+            return
+        existing = []
+        try:
+            if os.path.exists(self.quarantine_file):
+                with open(self.quarantine_file, 'r', encoding='utf-8') as f:
+                    existing = json.load(f)
+            known = {self._quarantine_key(entry) for entry in existing}
+            new = []
+            for entry in rejected:
+                key = self._quarantine_key(entry)
+                if key not in known:
+                    known.add(key)
+                    new.append(entry)
+            if not new:
+                return
+            print(f"{len(new)} score(s) invalide(s) mis en quarantaine dans {self.quarantine_file}")
+            with open(self.quarantine_file, 'w', encoding='utf-8') as f:
+                json.dump(existing + new, f, indent=2, ensure_ascii=False)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Erreur lors de la mise en quarantaine: {e}")
     
     def _save_scores(self):
         """Enregistre les scores dans le fichier JSON"""
-        try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(self.scores, f, indent=2, ensure_ascii=False)
-            return True
-        except IOError as e:
-            print(f"Erreur lors de l'enregistrement des scores: {e}")
+        if self.readonly:
+            print("Erreur lors de l'enregistrement des scores: mode lecture seule")
             return False
+        with self._lock:
+            try:
+                with self._file_lock:
+                    self._merge_foreign()
+                    # Écriture dans un fichier temporaire puis remplacement atomique :
+                    # un autre processus ne lit jamais un fichier à moitié écrit
+                    tmp_path = self.filename + ".tmp"
+                    with open(tmp_path, 'wb') as f:
+                        f.write(dumps(self.scores))
+                        if self.sync:
+                            f.flush()
+                            os.fsync(f.fileno())
+                    os.replace(tmp_path, self.filename)
+                    self._stamp = self._stat_stamp(os.stat(self.filename))
+                self._known = {dedup_key(score) for score in self.scores}
+                self._pending = 0
+                self._cancel_timer()
+                return True
+            except IOError as e:
+                print(f"Erreur lors de l'enregistrement des scores: {e}")
+                return False
+    
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+    
+    def flush(self):
+        """Écrit immédiatement les manches en attente
+        
+        Returns:
+            bool: True si rien n'était en attente ou si l'écriture a réussi
+        """
+        with self._lock:
+            if not self._pending:
+                return True
+            return self._save_scores()
     
     def add_score(self, player1_name, player1_result, player1_score, player1_balance,
                   player2_name, player2_result, player2_score, player2_balance,
-                  dealer_score):
+                  dealer_score, cards=None, hands=None):
         """Enregistre les résultats d'une manche
         
         Args:
@@ -62,10 +246,16 @@ class ScoreManager:
             player2_score (int): Score final du joueur 2
             player2_balance (int): Solde final du joueur 2
             dealer_score (int): Score final du croupier
+            cards (dict): Cartes de la manche {"joueur1", "joueur2", "croupier": [(valeur, couleur), ...]}
+                (optionnel ; non conservées par l'archive ni le fichier d'enregistrements)
+            hands (dict): Détail des mains {"joueur1", "joueur2": [{"resultat", "score", "mise", "cartes"}, ...]}
+                (optionnel ; enregistré sous "mains" seulement pour un joueur ayant séparé)
         
         Returns:
             bool: True si l'enregistrement a réussi, False sinon
         """
+        if self.readonly:
+            return False
         # Utiliser timestamp avec UUID pour garantir l'unicité
         unique_id = str(uuid.uuid4())[:8]  # Premier 8 caractères de UUID
         score_entry = {
@@ -87,9 +277,24 @@ class ScoreManager:
                 "score": dealer_score
             }
         }
+        for key, player_hands in (hands or {}).items():
+            if len(player_hands) > 1:
+                score_entry[key]["mains"] = player_hands
+        if cards:
+            score_entry["cartes"] = {key: [list(card) for card in hand] for key, hand in cards.items()}
         
-        self.scores.append(score_entry)
-        return self._save_scores()
+        with self._lock:
+            # La manche est visible immédiatement (get_scores, get_last_balances),
+            # l'écriture sur disque est regroupée
+            self.scores.append(score_entry)
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                return self._save_scores()
+            if self.flush_interval and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            return True
     
     def get_scores(self):
         """Retourne tous les scores enregistrés
@@ -99,13 +304,51 @@ class ScoreManager:
         """
         return self.scores
     
+    def get_all_scores(self):
+        """Retourne les manches archivées suivies des manches récentes
+        
+        Returns:
+            list: Liste de tous les scores, du plus ancien au plus récent
+        """
+        archive = self._get_archive()
+        if archive is None:
+            return self.scores
+        return list(archive) + list(self.scores)
+    
     def get_scores_count(self):
-        """Retourne le nombre de manches enregistrées
+        """Retourne le nombre de manches enregistrées (archives comprises)
         
         Returns:
             int: Nombre de manches
         """
-        return len(self.scores)
+        archive = self._get_archive()
+        return len(self.scores) + (len(archive) if archive is not None else 0)
+    
+    def archive_scores(self, keep=0):
+        """Déplace les anciennes manches vers l'archive compressée
+        
+        Args:
+            keep (int): Nombre de manches récentes à conserver dans le fichier JSON
+        
+        Returns:
+            int: Nombre de manches archivées
+        """
+        if self.readonly:
+            return 0
+        try:
+            with self._lock, self._file_lock:
+                self._merge_foreign()
+                old = self.scores[:-keep] if keep else self.scores
+                if not old:
+                    return 0
+                self._close_archive()
+                archived = write_segment(self.archive_file, old)
+                self.scores = self.scores[len(old):]
+                self._save_scores()
+                return archived
+        except (IOError, KeyError, ValueError) as e:
+            print(f"Erreur lors de l'archivage des scores: {e}")
+            return 0
     
     def get_player_stats(self, player_name):
         """Retourne les statistiques pour un joueur spécifique
@@ -114,14 +357,42 @@ class ScoreManager:
             player_name (str): Nom du joueur
         
         Returns:
-            dict: Statistiques du joueur (victoires, défaites, égalités, solde final)
+            dict: Statistiques du joueur (victoires, défaites, égalités, solde final) ;
+                un abandon compte comme une défaite, comme dans les comptes des joueurs,
+                et `abandons` en donne le détail
         """
         wins = 0
         losses = 0
         draws = 0
         blackjacks = 0
+        surrenders = 0
         final_balance = 0
         
+        # Manches archivées : seules les colonnes noms, résultats et soldes sont lues
+        archive = self._get_archive()
+        if archive is not None:
+            counts, archived_balance = archive.player_stats(player_name)
+            wins = counts.get("win", 0)
+            surrenders = counts.get("surrender", 0)
+            losses = counts.get("lose", 0) + surrenders
+            draws = counts.get("draw", 0)
+            blackjacks = counts.get("blackjack", 0)
+            if archived_balance is not None:
+                final_balance = archived_balance
+        
+        # Mode lecture seule : parcours des seuls octets noms / résultats
+        if self.readonly:
+            counts, recent_balance = self.scores.player_stats(player_name)
+            return {
+                "nom": player_name,
+                "victoires": wins + counts.get("win", 0),
+                "defaites": losses + counts.get("lose", 0) + counts.get("surrender", 0),
+                "egalites": draws + counts.get("draw", 0),
+                "blackjacks": blackjacks + counts.get("blackjack", 0),
+                "abandons": surrenders + counts.get("surrender", 0),
+                "solde_final": recent_balance if recent_balance is not None else final_balance
+            }
+        
         for score in self.scores:
             # Vérifier si c'est joueur 1
             if score["joueur1"]["nom"] == player_name:
@@ -134,6 +405,9 @@ class ScoreManager:
                     draws += 1
                 elif result == "blackjack":
                     blackjacks += 1
+                elif result == "surrender":
+                    losses += 1
+                    surrenders += 1
                 final_balance = score["joueur1"]["solde"]
             
             # Vérifier si c'est joueur 2
@@ -147,6 +421,9 @@ class ScoreManager:
                     draws += 1
                 elif result == "blackjack":
                     blackjacks += 1
+                elif result == "surrender":
+                    losses += 1
+                    surrenders += 1
                 final_balance = score["joueur2"]["solde"]
         
         return {
@@ -155,6 +432,7 @@ class ScoreManager:
             "defaites": losses,
             "egalites": draws,
             "blackjacks": blackjacks,
+            "abandons": surrenders,
             "solde_final": final_balance
         }
     
@@ -164,7 +442,15 @@ class ScoreManager:
         Returns:
             bool: True si l'effacement a réussi
         """
+        if self.readonly:
+            return False
         self.scores = []
+        self._close_archive()
+        if os.path.exists(self.archive_file):
+            try:
+                os.remove(self.archive_file)
+            except OSError:
+                return False
         return self._save_scores()
     
     def import_scores(self, filepath):
@@ -176,13 +462,17 @@ class ScoreManager:
         Returns:
             bool: True si l'importation a réussi, False sinon
         """
+        if self.readonly:
+            return False
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                imported_scores = json.load(f)
+            # Décodage validé : les entrées invalides vont en quarantaine
+            with open(filepath, 'rb') as f:
+                imported_scores, rejected = decode_scores(f.read())
+            self._quarantine(rejected)
             
-            # Vérifier que c'est une liste
-            if not isinstance(imported_scores, list):
-                return False
+            # Identifiants déjà archivés
+            archive = self._get_archive()
+            archived_ids = archive.ids() if archive is not None else set()
             
             # Ajouter les scores importés SANS DUPLICATES
             # Vérifier chaque score importé pour éviter les doublons
@@ -192,7 +482,9 @@ class ScoreManager:
                 
                 # Vérifier par ID en priorité
                 imported_id = imported_score.get("id")
-                if imported_id:
+                if imported_id in archived_ids:
+                    is_duplicate = True
+                elif imported_id:
                     for existing_score in self.scores:
                         if existing_score.get("id") == imported_id:
                             is_duplicate = True
@@ -212,8 +504,43 @@ class ScoreManager:
                     self.scores.append(imported_score)
             
             return self._save_scores()
-        except (json.JSONDecodeError, IOError, FileNotFoundError):
+        except (SchemaError, IOError, FileNotFoundError):
+            return False
+    
+    def import_many(self, filepaths, workers=None):
+        """Importe plusieurs exports en une seule passe (fusion triée par date)
+        
+        L'historique actuel et les exports sont fusionnés en flux puis le
+        fichier est réécrit une seule fois ; les doublons (même ID) sont écartés.
+        
+        Args:
+            filepaths (list): Chemins des fichiers à importer
+            workers (int): Nombre de processus d'analyse (par défaut : nombre de CPU)
+        
+        Returns:
+            bool: True si tous les fichiers ont été importés, False sinon
+        """
+        if self.readonly:
+            return False
+        try:
+            with self._lock, self._file_lock:
+                if not self.flush():
+                    return False
+                sources = list(filepaths)
+                if os.path.exists(self.filename):
+                    sources.insert(0, self.filename)
+                archive = self._get_archive()
+                report = merge_score_files(sources, self.filename, workers,
+                                           exclude=archive.ids() if archive is not None else None)
+                # Les entrées invalides écartées par la fusion vont en quarantaine
+                self._quarantine(report["rejetees"])
+                rejected = self.rejected
+                self._load_scores()
+                self.rejected = rejected
+        except IOError as e:
+            print(f"Erreur lors de l'importation des scores: {e}")
             return False
+        return not report["erreurs"]
     
     def export_scores(self, filepath):
         """Exporte tous les scores vers un fichier JSON
@@ -225,23 +552,46 @@ class ScoreManager:
             bool: True si l'exportation a réussi, False sinon
         """
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.scores, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(dumps([score if isinstance(score, dict) else score.to_dict()
+                               for score in self.get_all_scores()]))
             return True
         except IOError:
             return False
     
+    def export_records(self, filepath):
+        """Exporte tous les scores vers un fichier d'enregistrements binaire
+        
+        Le fichier produit s'ouvre avec ScoreManager(filepath, readonly=True).
+        
+        Args:
+            filepath (str): Chemin du fichier de destination
+        
+        Returns:
+            bool: True si l'exportation a réussi, False sinon
+        """
+        try:
+            write_records(filepath, self.get_all_scores())
+            return True
+        except (IOError, KeyError, ValueError):
+            return False
+    
     def get_last_balances(self):
-        """Retourne les derniers soldes des joueurs
+        """Retourne les soldes de la dernière manche, par nom de joueur
         
         Returns:
-            dict: {"Joueur 1": balance1, "Joueur 2": balance2} ou {}
+            dict: {nom: solde} pour les joueurs de la dernière manche, ou {}
         """
-        if not self.scores:
+        if self.readonly:
+            # Noms et soldes lus directement dans le dernier enregistrement
+            return self.scores.last_balances()
+        if self.scores:
+            last_score = self.scores[-1]
+        else:
+            archive = self._get_archive()
+            last_score = archive.last_record() if archive is not None else None
+        if last_score is None:
             return {}
         
-        last_score = self.scores[-1]  # Dernier score
-        return {
-            "Joueur 1": last_score["joueur1"]["solde"],
-            "Joueur 2": last_score["joueur2"]["solde"]
-        }
+        player1, player2 = last_score["joueur1"], last_score["joueur2"]
+        return {player1["nom"]: player1["solde"], player2["nom"]: player2["solde"]}
@@ -0,0 +1,138 @@
+# Nom : score_merge.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Fusion de plusieurs exports scores.json (fusion k-voies en flux)
+#
+# Utilisation :
+#   python score_merge.py -o fusion.json table1.json table2.json table3.json
+#
+# Chaque export est lu et trié par date (dans des processus séparés lorsque
+# les fichiers sont nombreux), écrit en fichier temporaire d'une entrée par
+# ligne, puis les fichiers triés sont fusionnés en flux avec heapq.merge.
+# Les doublons sont écartés par table de hachage sur l'identifiant, et le
+# résultat est écrit en une seule passe.
+
+import argparse
+import heapq
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+
+from score_schema import SchemaError, decode_scores, loads
+
+PARALLEL_MIN_FILES = 4  # En dessous, l'analyse reste dans le processus courant
+
+
+def dedup_key(score):
+    """Clé de doublon : l'identifiant, sinon date + joueurs (anciens scores)"""
+    score_id = score.get("id")
+    if score_id:
+        return score_id
+    return (score.get("timestamp"),
+            json.dumps(score.get("joueur1"), sort_keys=True),
+            json.dumps(score.get("joueur2"), sort_keys=True))
+
+
+def _sort_run(args):
+    """Lit un export et l'écrit trié par date, une entrée JSON par ligne
+
+    Returns:
+        tuple: (chemin source, chemin du fichier trié ou None si illisible,
+                entrées rejetées sous forme {"entree", "erreur"})
+    """
+    source, run_path = args
+    try:
+        # Les entrées non conformes au schéma sont écartées (et renvoyées)
+        with open(source, 'rb') as f:
+            scores, rejected = decode_scores(f.read())
+    except (SchemaError, IOError):
+        return source, None, []
+    scores.sort(key=lambda score: score.get("timestamp") or "")
+    with open(run_path, 'w', encoding='utf-8') as f:
+        for score in scores:
+            f.write(json.dumps(score, ensure_ascii=False))
+            f.write("\n")
+    return source, run_path, rejected
+
+
+def _read_run(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            score = loads(line)
+            yield score.get("timestamp") or "", score
+
+
+def merge_score_files(filepaths, output, workers=None, exclude=None):
+    """Fusionne plusieurs exports en un seul fichier trié par date, sans doublons
+
+    Args:
+        filepaths (list): Exports scores.json à fusionner
+        output (str): Fichier de sortie (même format que scores.json)
+        workers (int): Nombre de processus d'analyse (par défaut : nombre de CPU)
+        exclude (set): Clés de doublon déjà connues (ex. identifiants archivés)
+
+    Returns:
+        dict: {"fichiers": n, "manches": écrites, "doublons": n, "erreurs": [chemins],
+               "rejetees": [{"entree", "erreur"}] (entrées non conformes écartées)}
+    """
+    tmpdir = tempfile.mkdtemp(prefix="blackjack-merge-")
+    try:
+        jobs = [(path, os.path.join(tmpdir, f"run_{idx}.jsonl")) for idx, path in enumerate(filepaths)]
+        if len(jobs) >= PARALLEL_MIN_FILES and workers != 1:
+            with multiprocessing.Pool(workers) as pool:
+                runs = pool.map(_sort_run, jobs)
+        else:
+            runs = [_sort_run(job) for job in jobs]
+
+        errors = [source for source, run_path, _ in runs if run_path is None]
+        rejected = [entry for _, _, run_rejected in runs for entry in run_rejected]
+        streams = [_read_run(run_path) for _, run_path, _ in runs if run_path is not None]
+
+        seen = set(exclude) if exclude else set()
+        written = duplicates = 0
+        tmp_output = output + ".tmp"
+        with open(tmp_output, 'w', encoding='utf-8') as f:
+            f.write("[")
+            for _, score in heapq.merge(*streams, key=lambda item: item[0]):
+                key = dedup_key(score)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                # Même mise en forme que json.dump(liste, indent=2)
+                text = json.dumps(score, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                f.write(("\n  " if not written else ",\n  ") + text)
+                written += 1
+            f.write("\n]" if written else "]")
+        os.replace(tmp_output, output)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    return {
+        "fichiers": len(filepaths),
+        "manches": written,
+        "doublons": duplicates,
+        "erreurs": errors,
+        "rejetees": rejected
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fusionne plusieurs exports scores.json")
+    parser.add_argument("files", nargs="+", help="exports à fusionner")
+    parser.add_argument("-o", "--output", required=True, help="fichier fusionné")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="processus d'analyse")
+    args = parser.parse_args(argv)
+
+    report = merge_score_files(args.files, args.output, args.workers)
+    report["rejetees"] = len(report["rejetees"])
+    print(json.dumps(report, ensure_ascii=False))
+    return 1 if report["erreurs"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,197 @@
+# Nom : score_records.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Fichier binaire d'enregistrements à taille fixe, lu en mémoire projetée
+#
+# Format :
+#   MAGIC (4) | version (1) | taille d'un enregistrement (2) | nombre (8)
+#   | taille de l'en-tête (4) | en-tête JSON {"names": [...], "results": [...]}
+#   | enregistrements de RECORD.size octets
+#
+# Dans un enregistrement, les champs lus par les statistiques (noms et résultats)
+# sont contigus en tête : un parcours par joueur ne lit que ces 6 octets.
+
+import json
+import mmap
+import os
+import struct
+
+from score_archive import _from_cents, _from_millis, _id_text, _to_cents, _to_millis
+
+MAGIC = b"BJSR"
+VERSION = 1
+_PREFIX = struct.Struct("<4sBHQI")
+# nom1, res1, nom2, res2 | solde1, solde2 | timestamp | id | score1, score2, croupier
+RECORD = struct.Struct("<HBHBqqq8sBBB")
+_KEYS = struct.Struct("<HBHB")
+_BALANCES = struct.Struct("<qq")
+BALANCE_OFFSET = _KEYS.size
+TIMESTAMP_OFFSET = BALANCE_OFFSET + _BALANCES.size
+ID_OFFSET = TIMESTAMP_OFFSET + 8
+
+
+def write_records(path, scores):
+    """Écrit des scores dans un fichier d'enregistrements à taille fixe
+
+    Args:
+        path (str): Chemin du fichier de destination
+        scores (iterable): Entrées au format de ScoreManager
+
+    Returns:
+        int: Nombre d'enregistrements écrits
+    """
+    names, results = {}, {}
+    packed = []
+    for score in scores:
+        p1, p2 = score["joueur1"], score["joueur2"]
+        packed.append(RECORD.pack(
+            names.setdefault(p1["nom"], len(names)), results.setdefault(p1["resultat"], len(results)),
+            names.setdefault(p2["nom"], len(names)), results.setdefault(p2["resultat"], len(results)),
+            _to_cents(p1["solde"]), _to_cents(p2["solde"]),
+            _to_millis(score["timestamp"]),
+            _id_text(score).encode("ascii", "replace")[:8],
+            p1["score"], p2["score"], score["croupier"]["score"]
+        ))
+    header = json.dumps({"names": list(names), "results": list(results)},
+                        ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, RECORD.size, len(packed), len(header)))
+        f.write(header)
+        f.write(b"".join(packed))
+    return len(packed)
+
+
+class RecordView:
+    """Vue paresseuse sur un enregistrement : rien n'est décodé avant l'accès
+
+    S'utilise comme une entrée de ScoreManager (score["joueur1"]["nom"], ...).
+    """
+
+    __slots__ = ("_file", "_offset")
+
+    def __init__(self, records, offset):
+        self._file = records
+        self._offset = offset
+
+    def _fields(self):
+        return RECORD.unpack_from(self._file.buffer, self._offset)
+
+    def __getitem__(self, key):
+        f = self._file
+        if key == "id":
+            start = self._offset + ID_OFFSET
+            raw = f.buffer[start:start + 8]
+            return bytes(raw).rstrip(b"\0").decode("ascii")
+        if key == "timestamp":
+            return _from_millis(struct.unpack_from("<q", f.buffer, self._offset + TIMESTAMP_OFFSET)[0])
+        if key == "croupier":
+            return {"score": f.buffer[self._offset + RECORD.size - 1]}
+        fields = self._fields()
+        if key == "joueur1":
+            return {"nom": f.names[fields[0]], "resultat": f.results[fields[1]],
+                    "score": fields[8], "solde": _from_cents(fields[4])}
+        if key == "joueur2":
+            return {"nom": f.names[fields[2]], "resultat": f.results[fields[3]],
+                    "score": fields[9], "solde": _from_cents(fields[5])}
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        """Matérialise l'enregistrement au format de ScoreManager"""
+        return {key: self[key] for key in ("id", "timestamp", "joueur1", "joueur2", "croupier")}
+
+
+class ScoreRecordFile:
+    """Séquence en lecture seule sur un fichier d'enregistrements projeté en mémoire
+
+    Plusieurs processus peuvent ouvrir le même fichier : les pages sont
+    partagées par le cache du système.
+    """
+
+    def __init__(self, path):
+        """Ouvre un fichier d'enregistrements
+
+        Raises:
+            ValueError: Si le fichier n'est pas un fichier d'enregistrements valide
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size < _PREFIX.size:
+            self._file.close()
+            raise ValueError(f"Fichier d'enregistrements invalide: {path}")
+        self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, count, header_len = _PREFIX.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"Fichier d'enregistrements invalide: {path}")
+        header = json.loads(bytes(self.buffer[_PREFIX.size:_PREFIX.size + header_len]))
+        self.names = header["names"]
+        self.results = header["results"]
+        self.count = count
+        self.data_start = _PREFIX.size + header_len
+
+    def close(self):
+        self.buffer.close()
+        self._file.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.count))]
+        if idx < 0:
+            idx += self.count
+        if not 0 <= idx < self.count:
+            raise IndexError("index d'enregistrement hors limites")
+        return RecordView(self, self.data_start + idx * RECORD.size)
+
+    def __iter__(self):
+        for offset in range(self.data_start, self.data_start + self.count * RECORD.size, RECORD.size):
+            yield RecordView(self, offset)
+
+    def player_stats(self, player_name):
+        """Compte les résultats d'un joueur en ne lisant que noms et résultats
+
+        Returns:
+            tuple: ({résultat: nombre}, dernier solde ou None)
+        """
+        if player_name not in self.names:
+            return {}, None
+        name_idx = self.names.index(player_name)
+        per_result = [0] * len(self.results)
+        last_offset, last_slot = None, 0
+        unpack_from = _KEYS.unpack_from
+        buffer = self.buffer
+        for offset in range(self.data_start, self.data_start + self.count * RECORD.size, RECORD.size):
+            nom1, res1, nom2, res2 = unpack_from(buffer, offset)
+            if nom1 == name_idx:
+                per_result[res1] += 1
+                last_offset, last_slot = offset, 0
+            if nom2 == name_idx:
+                per_result[res2] += 1
+                last_offset, last_slot = offset, 1
+        final_balance = None
+        if last_offset is not None:
+            final_balance = _from_cents(_BALANCES.unpack_from(buffer, last_offset + BALANCE_OFFSET)[last_slot])
+        counts = {self.results[idx]: n for idx, n in enumerate(per_result)}
+        return counts, final_balance
+
+    def last_balances(self):
+        """Soldes du dernier enregistrement, sans lire le reste du fichier
+
+        Returns:
+            dict: {nom: solde} pour les deux joueurs du dernier enregistrement, ou {}
+        """
+        if not self.count:
+            return {}
+        offset = self.data_start + (self.count - 1) * RECORD.size
+        nom1, _, nom2, _ = _KEYS.unpack_from(self.buffer, offset)
+        solde1, solde2 = _BALANCES.unpack_from(self.buffer, offset + BALANCE_OFFSET)
+        return {self.names[nom1]: _from_cents(solde1), self.names[nom2]: _from_cents(solde2)}
\ No newline at end of file
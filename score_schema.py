@@ -0,0 +1,163 @@
+# Nom : score_schema.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Schéma des entrées de scores, décodage validé et JSON accéléré
+#
+# Si orjson (ou à défaut msgspec) est installé, il est utilisé pour lire et
+# écrire les fichiers de scores ; sinon le module json standard prend le relais.
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+RESULTS = ("win", "lose", "draw", "blackjack", "surrender")
+_RESULT_SET = frozenset(RESULTS)
+_NUMBER_TYPES = (int, float)
+# Erreurs possibles de loads() selon la bibliothèque utilisée
+DECODE_ERRORS = (ValueError, UnicodeDecodeError) + ((msgspec.DecodeError,) if msgspec else ())
+
+
+class SchemaError(ValueError):
+    """Entrée de score non conforme au schéma"""
+
+
+# -------------------- JSON rapide --------------------
+def loads(data):
+    """Décode du JSON (bytes ou str) avec la bibliothèque la plus rapide disponible"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Encode en JSON indenté (même mise en forme que json.dump(indent=2))
+
+    Returns:
+        bytes: Document JSON encodé en UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj):
+    """Encode en JSON compact terminé par un saut de ligne (fichiers d'une entrée par ligne)
+
+    Returns:
+        bytes: Ligne encodée en UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+# -------------------- Validation --------------------
+def _is_int(value):
+    return type(value) is int
+
+
+def _is_number(value):
+    return type(value) is int or type(value) is float
+
+
+def _check_player(player, key):
+    if type(player) is not dict:
+        raise SchemaError(f"{key} doit être un objet")
+    if type(player.get("nom")) is not str:
+        raise SchemaError(f"{key}.nom manquant ou invalide")
+    if player.get("resultat") not in RESULTS:
+        raise SchemaError(f"{key}.resultat invalide: {player.get('resultat')!r}")
+    if not _is_int(player.get("score")):
+        raise SchemaError(f"{key}.score manquant ou invalide")
+    if not _is_number(player.get("solde")):
+        raise SchemaError(f"{key}.solde manquant ou invalide")
+
+
+def validate_score(score):
+    """Vérifie qu'une entrée respecte le format de ScoreManager
+
+    Args:
+        score: Entrée décodée
+
+    Returns:
+        dict: L'entrée elle-même si elle est valide
+
+    Raises:
+        SchemaError: Si un champ est manquant ou du mauvais type
+    """
+    if type(score) is not dict:
+        raise SchemaError("l'entrée doit être un objet")
+    score_id = score.get("id")
+    if score_id is not None and type(score_id) is not str:
+        raise SchemaError("id invalide")
+    if type(score.get("timestamp")) is not str:
+        raise SchemaError("timestamp manquant ou invalide")
+    _check_player(score.get("joueur1"), "joueur1")
+    _check_player(score.get("joueur2"), "joueur2")
+    dealer = score.get("croupier")
+    if type(dealer) is not dict or not _is_int(dealer.get("score")):
+        raise SchemaError("croupier.score manquant ou invalide")
+    return score
+
+
+def _is_valid(score):
+    """Vérification rapide sans message d'erreur (chemin nominal du décodage)"""
+    try:
+        p1 = score["joueur1"]
+        p2 = score["joueur2"]
+        score_id = score.get("id")
+        return (type(score["timestamp"]) is str
+                and (score_id is None or type(score_id) is str)
+                and type(p1["nom"]) is str and p1["resultat"] in _RESULT_SET
+                and type(p1["score"]) is int and type(p1["solde"]) in _NUMBER_TYPES
+                and type(p2["nom"]) is str and p2["resultat"] in _RESULT_SET
+                and type(p2["score"]) is int and type(p2["solde"]) in _NUMBER_TYPES
+                and type(score["croupier"]["score"]) is int)
+    except (KeyError, TypeError, AttributeError):
+        return False
+
+
+def decode_scores(data):
+    """Décode un fichier de scores en une seule passe validée
+
+    Args:
+        data (bytes): Contenu du fichier
+
+    Returns:
+        tuple: (entrées valides, entrées rejetées sous forme {"entree", "erreur"})
+
+    Raises:
+        SchemaError: Si le document n'est pas du JSON ou pas une liste
+    """
+    try:
+        decoded = loads(data)
+    except DECODE_ERRORS as e:
+        raise SchemaError(f"JSON invalide: {e}")
+    if not isinstance(decoded, list):
+        raise SchemaError("le fichier doit contenir une liste de manches")
+
+    valid, rejected = [], []
+    append = valid.append
+    for score in decoded:
+        if type(score) is dict and _is_valid(score):
+            append(score)
+            continue
+        # Chemin lent : uniquement pour obtenir le motif du rejet
+        try:
+            append(validate_score(score))
+        except SchemaError as e:
+            rejected.append({"entree": score, "erreur": str(e)})
+    return valid, rejected
\ No newline at end of file
@@ -0,0 +1,87 @@
+# Nom : shoe_tracker.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Suivi de la composition du sabot et comptage des cartes
+
+from array import array
+from rules import SUITS, VALUES
+
+# Position de chaque rang dans le tableau de composition (ordre de VALUES)
+RANK_INDEX = {value: idx for idx, value in enumerate(VALUES)}
+
+# Poids de chaque rang (ordre de VALUES : 2..10, J, Q, K, A) par système de comptage
+COUNT_SYSTEMS = {
+    "hilo":   (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1),
+    "ko":     (1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1, -1),
+    "hiopt1": (0, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, 0),
+    "omega2": (1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0),
+    "zen":    (1, 1, 2, 2, 2, 1, 0, 0, -2, -2, -2, -2, -1),
+}
+
+
+class ShoeTracker:
+    """Composition restante du sabot et comptes courants, mis à jour à chaque tirage
+
+    Chaque tirage coûte une recherche de rang et quelques incréments : aucune
+    reconstruction du sabot n'est nécessaire. Les cartes sont comptées au moment
+    où elles sortent du sabot (la carte cachée du croupier comprise).
+    """
+
+    def __init__(self, decks=1, systems=("hilo",)):
+        """Initialise le suivi pour un sabot complet
+
+        Args:
+            decks (int): Nombre de paquets dans le sabot
+            systems (iterable): Systèmes de comptage suivis (clés de COUNT_SYSTEMS)
+        """
+        self.decks = decks
+        self.systems = tuple(systems)
+        # weights[rang] : poids du rang pour chaque système suivi
+        self.weights = tuple(tuple(COUNT_SYSTEMS[name][idx] for name in self.systems)
+                             for idx in range(len(VALUES)))
+        self.remaining = array('i', [0] * len(VALUES))
+        self.running = array('i', [0] * len(self.systems))
+        self.cards_left = 0
+        self.reset()
+
+    def reset(self):
+        """Remet le suivi à zéro pour un sabot neuf (appelé par create_deck)"""
+        per_rank = len(SUITS) * self.decks
+        for idx in range(len(self.remaining)):
+            self.remaining[idx] = per_rank
+        for idx in range(len(self.running)):
+            self.running[idx] = 0
+        self.cards_left = per_rank * len(VALUES)
+
+    def draw(self, card):
+        """Retire une carte de la composition et met à jour les comptes"""
+        idx = RANK_INDEX[card[0]]
+        self.remaining[idx] -= 1
+        self.cards_left -= 1
+        running = self.running
+        for pos, weight in enumerate(self.weights[idx]):
+            running[pos] += weight
+
+    def running_count(self, system="hilo"):
+        """Retourne le compte courant d'un système suivi"""
+        return self.running[self.systems.index(system)]
+
+    def true_count(self, system="hilo"):
+        """Retourne le compte réel (compte courant / paquets restants)"""
+        decks_left = self.cards_left / 52
+        if decks_left <= 0:
+            return 0.0
+        return self.running_count(system) / decks_left
+
+    def view(self):
+        """Vue sans copie sur les cartes restantes par rang (ordre de VALUES)
+
+        Returns:
+            memoryview: Vue en lecture seule sur le tableau de composition
+        """
+        return memoryview(self.remaining).toreadonly()
+
+    def composition(self):
+        """Retourne la composition restante sous forme de dictionnaire {rang: nombre}"""
+        return {value: self.remaining[idx] for idx, value in enumerate(VALUES)}
\ No newline at end of file
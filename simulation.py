@@ -0,0 +1,463 @@
+# Nom : simulation.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Simulation de bankroll avec stratégies de mise et de jeu interchangeables,
+#               estimation de l'avantage avec arrêt à la précision demandée
+
+import math
+import random
+from array import array
+from statistics import NormalDist
+from blackjack import BlackjackGame
+from hand import CARD_VALUES
+
+
+# -------------------- Stratégies de mise --------------------
+# Une stratégie de mise est un appelable (game, player, last_bet, last_net) -> montant.
+
+class FlatBet:
+    """Mise fixe à chaque manche"""
+
+    def __init__(self, amount=10):
+        self.amount = amount
+
+    def __call__(self, game, player, last_bet, last_net):
+        return self.amount
+
+
+class Martingale:
+    """Double la mise après chaque perte, revient à la mise de base après un gain"""
+
+    def __init__(self, base=10, max_bet=1000):
+        self.base = base
+        self.max_bet = max_bet
+
+    def __call__(self, game, player, last_bet, last_net):
+        if last_net < 0 and last_bet:
+            return min(last_bet * 2, self.max_bet)
+        return self.base
+
+
+class KellyCount:
+    """Mise proportionnelle à l'avantage estimé à partir du compte réel
+
+    L'avantage est approché par base_edge + edge_per_count * compte réel
+    (environ 0,5 % par point de Hi-Lo), la variance d'une manche par 1,3.
+    """
+
+    def __init__(self, min_bet=10, max_bet=500, fraction=0.5, system="hilo",
+                 base_edge=-0.005, edge_per_count=0.005, variance=1.3):
+        self.min_bet = min_bet
+        self.max_bet = max_bet
+        self.fraction = fraction
+        self.system = system
+        self.base_edge = base_edge
+        self.edge_per_count = edge_per_count
+        self.variance = variance
+
+    def __call__(self, game, player, last_bet, last_net):
+        edge = self.base_edge + self.edge_per_count * game.shoe.true_count(self.system)
+        if edge <= 0:
+            return self.min_bet
+        bet = player.balance * self.fraction * edge / self.variance
+        return max(self.min_bet, min(bet, self.max_bet))
+
+
+# -------------------- Stratégies de jeu --------------------
+# Une stratégie de jeu est un appelable (game, player) -> action parmi
+# "hit", "stand", "double", "split", "surrender". Une action refusée par le
+# moteur est remplacée par "hit" : une stratégie qui a un meilleur repli
+# vérifie elle-même game.can_double / game.can_split (voir basic_strategy).
+
+def dealer_mimic(game, player):
+    """Joue comme le croupier : tire jusqu'à 17"""
+    return "hit" if player.get_score() < 17 else "stand"
+
+
+def _upcard_value(game):
+    """Valeur de la carte visible du croupier (As = 11)"""
+    value = CARD_VALUES[game.dealer.get_visible_card()[0]]
+    return 11 if value == 1 else value
+
+
+def basic_strategy(game, player):
+    """Stratégie de base simplifiée (plusieurs paquets, S17)
+
+    Un double impossible (plus de deux cartes, total non autorisé, pas de
+    double après séparation) est remplacé par l'action de repli de la
+    stratégie de base : rester sur « double sinon rester » (17/18 souple),
+    tirer sinon. Une paire qui ne peut pas être séparée est jouée selon son total.
+    """
+    hand = player.current_hand
+    up = _upcard_value(game)
+    score = hand.get_score()
+
+    if len(hand) == 2:
+        # Paires
+        if game.can_split(player):
+            pair = CARD_VALUES[hand.cards[0][0]]
+            if pair in (1, 8):
+                return "split"
+            if (pair in (2, 3, 7) and up <= 7) or (pair == 6 and up <= 6) \
+                    or (pair == 9 and up not in (7, 10, 11)) or (pair == 4 and up in (5, 6)):
+                return "split"
+        # Abandon
+        if not hand.is_soft() and ((score == 16 and up >= 9) or (score == 15 and up == 10)):
+            return "surrender"
+
+    if hand.is_soft():
+        if score >= 19:
+            return "stand"
+        if score == 18:
+            if 3 <= up <= 6:
+                return "double" if game.can_double(player) else "stand"
+            return "stand" if up <= 8 else "hit"
+        if (score == 17 and 3 <= up <= 6) or (score in (15, 16) and 4 <= up <= 6) \
+                or (score in (13, 14) and up in (5, 6)):
+            return "double" if game.can_double(player) else "hit"
+        return "hit"
+
+    if score >= 17:
+        return "stand"
+    if score >= 13:
+        return "stand" if up <= 6 else "hit"
+    if score == 12:
+        return "stand" if 4 <= up <= 6 else "hit"
+    if score == 11 or (score == 10 and up <= 9) or (score == 9 and 3 <= up <= 6):
+        return "double" if game.can_double(player) else "hit"
+    return "hit"
+
+
+# -------------------- Résultats --------------------
+class SimulationResult:
+    """Résultats d'une simulation, stockés dans des tableaux compacts
+
+    Les trajectoires de bankroll sont conservées en float32 (4 octets par point),
+    session après session, dans un seul tableau contigu.
+    """
+
+    def __init__(self, sessions, points, keep_trajectories):
+        self.sessions = sessions
+        self.points = points
+        self.trajectories = array('f', bytes(4 * sessions * points)) if keep_trajectories else None
+        self.final = array('d', bytes(8 * sessions))
+        self.max_drawdown = array('d', bytes(8 * sessions))
+        self.rounds_played = array('i', bytes(4 * sessions))
+        self.ruined = array('b', bytes(sessions))
+
+    def trajectory(self, session):
+        """Vue sans copie sur la trajectoire d'une session
+
+        Raises:
+            ValueError: Si la simulation n'a pas conservé les trajectoires
+        """
+        if self.trajectories is None:
+            raise ValueError("Trajectoires non conservées (keep_trajectories=False)")
+        start = session * self.points
+        return memoryview(self.trajectories)[start:start + self.points]
+
+    def risk_of_ruin(self):
+        """Proportion des sessions ruinées"""
+        return sum(self.ruined) / self.sessions if self.sessions else 0.0
+
+    def mean_final(self):
+        """Bankroll finale moyenne"""
+        return sum(self.final) / self.sessions if self.sessions else 0.0
+
+    def drawdown_quantiles(self, quantiles=(0.5, 0.9, 0.99)):
+        """Quantiles de la distribution des pertes maximales (drawdown)
+
+        Returns:
+            dict: {quantile: drawdown}
+        """
+        ordered = sorted(self.max_drawdown)
+        if not ordered:
+            return {q: 0.0 for q in quantiles}
+        last = len(ordered) - 1
+        return {q: ordered[min(last, int(q * len(ordered)))] for q in quantiles}
+
+    def summary(self):
+        """Résumé des principaux indicateurs"""
+        return {
+            "sessions": self.sessions,
+            "bankroll_moyenne": self.mean_final(),
+            "risque_de_ruine": self.risk_of_ruin(),
+            "drawdown": self.drawdown_quantiles()
+        }
+
+
+class RunningStats:
+    """Moyenne et variance en flux (algorithme de Welford), sans conserver les valeurs"""
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # Somme des carrés des écarts à la moyenne
+
+    def add(self, value):
+        """Ajoute une observation"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def variance(self):
+        """Variance de l'échantillon"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stdev(self):
+        """Écart type de l'échantillon"""
+        return math.sqrt(self.variance())
+
+    def half_width(self, confidence=0.95):
+        """Demi-largeur de l'intervalle de confiance de la moyenne (loi normale)"""
+        if self.count < 2:
+            return math.inf
+        return z_score(confidence) * self.stdev() / math.sqrt(self.count)
+
+    def summary(self, confidence=0.95):
+        """Résumé : moyenne, écart type et intervalle de confiance"""
+        half = self.half_width(confidence)
+        return {
+            "n": self.count,
+            "moyenne": self.mean,
+            "ecart_type": self.stdev(),
+            "intervalle": (self.mean - half, self.mean + half)
+        }
+
+
+def z_score(confidence):
+    """Quantile de la loi normale pour un niveau de confiance bilatéral (0.95 -> 1.96)"""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+# -------------------- Simulateur --------------------
+class Simulator:
+    """Joue des sessions sans interface avec des stratégies interchangeables
+
+    Chaque partie fait jouer les deux places de la table : une session
+    correspond à une place, deux sessions sont donc simulées par partie.
+    """
+
+    def __init__(self, betting=None, playing=basic_strategy, rules=None,
+                 bankroll=1000, min_bet=10, seed=None):
+        """Initialise le simulateur
+
+        Args:
+            betting (callable): Stratégie de mise (FlatBet par défaut)
+            playing (callable): Stratégie de jeu
+            rules (Rules): Règles de la table
+            bankroll (float): Bankroll de départ de chaque session
+            min_bet (float): Mise minimale ; en dessous, la session est ruinée
+            seed (int): Graine du générateur aléatoire
+        """
+        self.betting = betting if betting is not None else FlatBet(min_bet)
+        self.playing = playing
+        self.rules = rules
+        self.bankroll = bankroll
+        self.min_bet = min_bet
+        self.seed = seed
+
+    def _play_turns(self, game, playing):
+        """Fait jouer chaque main des deux places selon une stratégie de jeu"""
+        while game.current_player:
+            player = game.current_player
+            while game.can_player_act(player):
+                action = playing(game, player)
+                if action == "split" and game.split(player):
+                    continue
+                if action == "double" and game.double_down(player) is not None:
+                    break
+                if action == "surrender" and game.surrender(player):
+                    break
+                if action == "stand":
+                    game.stand(player)
+                elif game.hit(player) == "21":
+                    game.stand(player)
+            game.switch_player()
+
+    def run(self, sessions=1000, rounds=100, keep_trajectories=True):
+        """Simule des sessions de plusieurs manches
+
+        Args:
+            sessions (int): Nombre de sessions
+            rounds (int): Nombre de manches par session
+            keep_trajectories (bool): Conserver la bankroll après chaque manche
+
+        Returns:
+            SimulationResult: Trajectoires, bankrolls finales, drawdowns et ruines
+        """
+        rng = random.Random(self.seed)  # Propre au simulateur : l'aléa global n'est pas touché
+        result = SimulationResult(sessions, rounds + 1, keep_trajectories)
+        trajectories = result.trajectories
+        points = rounds + 1
+        betting = self.betting
+        min_bet = self.min_bet
+
+        for first in range(0, sessions, 2):
+            game = BlackjackGame(self.rules, score_file=None, rng=rng)
+            game.create_deck()
+            seats = [(game.player1, first)]
+            if first + 1 < sessions:
+                seats.append((game.player2, first + 1))
+            else:
+                game.player2.balance = 0  # Place vide
+            state = {}
+            for player, session in seats:
+                player.balance = self.bankroll
+                state[session] = [0, 0, self.bankroll, 0.0]  # dernière mise, dernier gain, pic, drawdown
+                if trajectories is not None:
+                    trajectories[session * points] = self.bankroll
+
+            for round_idx in range(1, points):
+                in_play = []
+                for player, session in seats:
+                    if player.balance < min_bet:
+                        continue
+                    entry = state[session]
+                    bet = betting(game, player, entry[0], entry[1])
+                    bet = max(min_bet, min(bet, player.balance))
+                    player.place_bet(bet)
+                    entry[0] = bet
+                    in_play.append((player, session, player.balance + bet))
+                if not in_play:
+                    break
+
+                game.start_new_round()
+                self._play_turns(game, self.playing)
+                game.dealer_play()
+                for player, session, before in in_play:
+                    game.settle_player(player)
+                    balance = player.balance
+                    entry = state[session]
+                    entry[1] = balance - before
+                    if balance > entry[2]:
+                        entry[2] = balance
+                    elif entry[2] - balance > entry[3]:
+                        entry[3] = entry[2] - balance
+                    result.rounds_played[session] = round_idx
+                    if trajectories is not None:
+                        trajectories[session * points + round_idx] = balance
+
+            for player, session in seats:
+                result.final[session] = player.balance
+                result.max_drawdown[session] = state[session][3]
+                result.ruined[session] = player.balance < min_bet
+            # Compléter les trajectoires des sessions arrêtées avant la fin
+            if trajectories is not None:
+                for player, session in seats:
+                    start = session * points + result.rounds_played[session] + 1
+                    for pos in range(start, (session + 1) * points):
+                        trajectories[pos] = player.balance
+        return result
+
+    def estimate(self, policies=None, precision=0.005, confidence=0.95, common_random_numbers=True,
+                 min_rounds=1000, max_rounds=1000000, check_every=1000):
+        """Estime le gain moyen par manche (en mises) et s'arrête à la précision demandée
+
+        Chaque manche, les deux places misent une unité ; l'observation est le
+        gain net moyen des deux places. Moyenne et variance sont tenues en
+        flux : la simulation s'arrête dès que la demi-largeur de l'intervalle
+        de confiance est inférieure à `precision`. Avec plusieurs stratégies,
+        c'est l'écart à la première (la référence) qui doit atteindre cette
+        précision.
+
+        Avec des nombres aléatoires communs, toutes les stratégies jouent
+        chaque manche avec les mêmes cartes : les écarts entre stratégies
+        varient beaucoup moins et la précision est atteinte en bien moins de
+        manches.
+
+        Args:
+            policies (dict): {nom: stratégie de jeu} ({"strategie": playing} par défaut)
+            precision (float): Demi-largeur visée de l'intervalle (en mises)
+            confidence (float): Niveau de confiance de l'intervalle
+            common_random_numbers (bool): Mêmes cartes pour toutes les stratégies
+            min_rounds (int): Manches jouées avant le premier test d'arrêt
+            max_rounds (int): Nombre maximal de manches
+            check_every (int): Manches entre deux tests d'arrêt
+
+        Returns:
+            dict: Manches jouées, convergence, résumé par stratégie et écarts à la référence
+        """
+        if policies is None:
+            policies = {"strategie": self.playing}
+        rng = random.Random(self.seed)  # Sabot commun et graines des parties
+        names = list(policies)
+        # Un générateur par partie : l'aléa global n'est pas touché
+        games = [BlackjackGame(self.rules, score_file=None, rng=random.Random(rng.getrandbits(64)))
+                 for _ in names]
+        stats = [RunningStats() for _ in names]
+        diffs = [RunningStats() for _ in names[1:]]
+        targets = diffs if diffs else stats
+        tables = games[0].tables
+        bankroll = self.bankroll
+        deck = None
+        if common_random_numbers:
+            deck = list(tables.shoe)
+            rng.shuffle(deck)
+            for game in games:
+                game.shoe.reset()
+        else:
+            for game in games:
+                game.create_deck()
+
+        rounds = 0
+        converged = False
+        while rounds < max_rounds:
+            if deck is not None:
+                # Sabot commun : chaque stratégie part des mêmes cartes
+                if len(deck) < tables.reshuffle_at:
+                    deck = list(tables.shoe)
+                    rng.shuffle(deck)
+                    for game in games:
+                        game.shoe.reset()
+                # Même graine pour toutes les parties : un remélange d'urgence
+                # en cours de manche leur donne aussi les mêmes cartes
+                round_seed = rng.getrandbits(64)
+                for game in games:
+                    game.deck = deck[:]
+                    game.rng.seed(round_seed)
+            nets = []
+            for game, playing, stat in zip(games, policies.values(), stats):
+                for player in (game.player1, game.player2):
+                    player.balance = bankroll
+                    player.place_bet(1)
+                game.start_new_round()
+                self._play_turns(game, playing)
+                game.dealer_play()
+                game.settle_player(game.player1)
+                game.settle_player(game.player2)
+                net = (game.player1.balance + game.player2.balance - 2 * bankroll) / 2
+                stat.add(net)
+                nets.append(net)
+            for diff, net in zip(diffs, nets[1:]):
+                diff.add(net - nets[0])
+            if deck is not None:
+                # La suite du sabot est celle de la stratégie qui a tiré le plus de cartes
+                lead = min(games, key=lambda game: len(game.deck))
+                deck = lead.deck
+                for game in games:
+                    if game is not lead:
+                        _copy_shoe(lead.shoe, game.shoe)
+            rounds += 1
+            if rounds >= min_rounds and rounds % check_every == 0 \
+                    and all(stat.half_width(confidence) <= precision for stat in targets):
+                converged = True
+                break
+
+        return {
+            "manches": rounds,
+            "converge": converged,
+            "strategies": {name: stat.summary(confidence) for name, stat in zip(names, stats)},
+            "ecarts": {name: diff.summary(confidence) for name, diff in zip(names[1:], diffs)}
+        }
+
+
+def _copy_shoe(source, target):
+    """Recopie l'état d'un suivi de sabot (comptes compris) dans un autre"""
+    target.remaining[:] = source.remaining
+    target.running[:] = source.running
+    target.cards_left = source.cards_left
\ No newline at end of file
@@ -0,0 +1,364 @@
+# Nom : table_canvas.py
+# Auteur : Arda Tuna Kaya
+# Date : 18.10.2026
+# Version : 1.0
+# Description : Rendu de la table sur un Canvas unique (mode retenu)
+#
+# Chaque carte est un élément image du Canvas, créé une seule fois. Une mise à
+# jour compare l'état voulu à l'état affiché et ne touche que les éléments
+# modifiés (carte ajoutée, retirée ou retournée, texte changé). Les cartes
+# distribuées partent du sabot et glissent jusqu'à leur place : une seule boucle
+# d'animation déplace tous les éléments en mouvement et mesure la durée de
+# chaque image.
+
+import time
+import tkinter as tk
+from collections import deque
+
+# -------------------- Paramètres visuels --------------------
+CARD_WIDTH = 130          # Largeur des cartes en pixels
+CARD_HEIGHT = int(CARD_WIDTH * 1.45)
+CARD_SPACING = 8          # Espacement horizontal entre les cartes
+TABLE_BG = "#0b3d0b"      # Couleur du fond (vert foncé)
+PANEL_BG = "#114d14"      # Couleur des panneaux joueurs
+PANEL_BORDER = "#2e6b31"  # Bordure des panneaux
+GOLD = "#D4AF37"          # Couleur dorée pour les accents
+TEXT_CLR = "#f4f4f4"      # Couleur du texte principal
+SUBTEXT_CLR = "#cfe8cf"   # Couleur du texte secondaire
+WARN_CLR = "#ffb74d"      # Couleur orange pour les mises
+ACCENT_BLUE = "#6ec6ff"   # Couleur bleue pour les statistiques
+
+ZONE_PAD = 14             # Marge autour et entre les zones
+ZONE_TITLE_H = 34         # Hauteur réservée au titre d'une zone
+TEXT_LINE_H = 22          # Hauteur d'une ligne de texte sous les cartes
+# Textes d'une zone : clé -> (police, couleur) ; le score s'affiche à droite du titre,
+# les autres textes sous les cartes
+TEXT_STYLES = {
+    "score": (("Helvetica", 12), TEXT_CLR),
+    "balance": (("Helvetica", 10), SUBTEXT_CLR),
+    "bet": (("Helvetica", 10), WARN_CLR),
+}
+
+# -------------------- Animation --------------------
+FRAME_MS = 16             # Intervalle visé entre deux images (~60 par seconde)
+DEAL_MS = 260             # Trajet d'une carte depuis le sabot
+DEAL_STAGGER_MS = 110     # Décalage entre deux cartes distribuées ensemble
+MOVE_MS = 160             # Recentrage des cartes déjà posées
+FRAME_HISTORY = 600       # Nombre de durées d'image conservées pour la mesure
+
+
+# -------------------- Géométrie (partagée avec l'export hors écran) --------------------
+def table_layout(width, height, seats):
+    """Rectangles des zones : croupier en haut, places des joueurs côte à côte en bas
+
+    Args:
+        width (int): Largeur de la table
+        height (int): Hauteur de la table
+        seats (list): Clés des places
+
+    Returns:
+        dict: clé de zone -> (x0, y0, x1, y1)
+    """
+    dealer_bottom = ZONE_PAD + ZONE_TITLE_H + CARD_HEIGHT + ZONE_PAD
+    boxes = {"dealer": (ZONE_PAD, ZONE_PAD, width - ZONE_PAD, dealer_bottom)}
+    if seats:
+        seat_width = (width - ZONE_PAD * (len(seats) + 1)) / len(seats)
+        seats_bottom = max(height - ZONE_PAD, dealer_bottom + ZONE_PAD + ZONE_TITLE_H + CARD_HEIGHT
+                           + TEXT_LINE_H * 2 + 8)
+        for idx, key in enumerate(seats):
+            x0 = ZONE_PAD + idx * (seat_width + ZONE_PAD)
+            boxes[key] = (x0, dealer_bottom + ZONE_PAD, x0 + seat_width, seats_bottom)
+    return boxes
+
+
+def card_position(zone_key, box, idx, count):
+    """Position d'une carte : rangée centrée, chevauchement si la zone est trop étroite"""
+    x0, y0, x1, _ = box
+    if zone_key == "dealer":
+        x1 -= CARD_WIDTH + ZONE_PAD  # Place réservée au sabot
+    step = CARD_WIDTH + CARD_SPACING
+    room = x1 - x0 - 2 * ZONE_PAD - CARD_WIDTH
+    if count > 1 and step * (count - 1) > room:
+        step = max(room, 0) / (count - 1)
+    row_width = CARD_WIDTH + step * (count - 1)
+    return round(x0 + (x1 - x0 - row_width) / 2 + idx * step), y0 + ZONE_TITLE_H
+
+
+def shoe_position(dealer_box):
+    x0, y0, x1, _ = dealer_box
+    return x1 - CARD_WIDTH - 12, y0 + ZONE_TITLE_H
+
+
+def text_position(box, text_key, line):
+    """Position d'un texte de zone : le score à droite du titre, les autres
+    sous les cartes (line = rang parmi ceux-ci)
+
+    Returns:
+        tuple: (x, y, ancre Tk "ne" ou "n")
+    """
+    x0, y0, x1, _ = box
+    if text_key == "score":
+        return x1 - 10, y0 + 8, "ne"
+    return (x0 + x1) / 2, y0 + ZONE_TITLE_H + CARD_HEIGHT + 6 + line * TEXT_LINE_H, "n"
+
+
+class _Zone:
+    """Zone de la table (croupier ou place d'un joueur) et ses éléments affichés"""
+
+    __slots__ = ("key", "title", "box", "cards", "items", "shown", "targets",
+                 "texts", "panel", "title_item", "text_items", "dirty")
+
+    def __init__(self, key, title, text_keys):
+        self.key = key
+        self.title = title
+        self.box = (0, 0, 0, 0)
+        self.cards = []      # État voulu : (valeur, couleur) ou None pour une carte cachée
+        self.items = []      # Éléments image du Canvas, dans l'ordre des cartes
+        self.shown = []      # Carte actuellement affichée par chaque élément
+        self.targets = []    # Position finale de chaque élément
+        self.texts = dict.fromkeys(text_keys, "")
+        self.panel = None
+        self.title_item = None
+        self.text_items = {}
+        self.dirty = False
+
+
+class TableCanvas(tk.Canvas):
+    """Table de jeu dessinée sur un seul Canvas
+
+    Le croupier occupe le haut de la table, les places des joueurs se
+    partagent le bas ; le nombre de places n'est pas limité (les cartes se
+    chevauchent lorsque la place manque).
+    """
+
+    def __init__(self, parent, card_image, back_image, seats, animate=True, **options):
+        """Initialise la table
+
+        Args:
+            parent: Widget parent
+            card_image (callable): (valeur, couleur) -> image Tk de la carte
+            back_image (callable): () -> image Tk du dos de carte
+            seats (list): Places des joueurs [(clé, titre), ...]
+            animate (bool): Animer la distribution (False : cartes posées directement)
+        """
+        options.setdefault("bg", TABLE_BG)
+        options.setdefault("highlightthickness", 0)
+        super().__init__(parent, **options)
+        self.card_image = card_image
+        self.back_image = back_image
+        self.animate = animate
+
+        self.zones = {"dealer": _Zone("dealer", "Croupier", ("score",))}
+        for key, title in seats:
+            self.zones[key] = _Zone(key, title, ("score", "balance", "bet"))
+        for zone in self.zones.values():
+            zone.panel = self.create_rectangle(0, 0, 0, 0, fill=PANEL_BG, outline=PANEL_BORDER, width=2)
+            zone.title_item = self.create_text(0, 0, text=zone.title, anchor="nw", fill=TEXT_CLR,
+                                               font=("Helvetica", 14, "bold"))
+            for text_key in zone.texts:
+                font, color = TEXT_STYLES[text_key]
+                anchor = text_position(zone.box, text_key, 0)[2]
+                zone.text_items[text_key] = self.create_text(0, 0, text="", anchor=anchor,
+                                                             fill=color, font=font)
+
+        self._shoe = None          # Élément du sabot (dos de carte), créé à la première donne
+        self._moving = {}          # élément -> (x0, y0, x1, y1, début, durée)
+        self._next_deal = 0.0
+        self._frame_job = None
+        self._idle_callbacks = []
+        self._last_frame = None
+        self.frame_times = deque(maxlen=FRAME_HISTORY)      # Durée de calcul + dessin d'une image
+        self.frame_intervals = deque(maxlen=FRAME_HISTORY)  # Écart entre deux images animées
+
+        self._layout()
+        self.bind("<Configure>", lambda event: self._layout())
+
+    # -------------------- Disposition --------------------
+    def _size(self):
+        width = self.winfo_width()
+        height = self.winfo_height()
+        if width <= 1 or height <= 1:
+            width, height = int(self["width"]), int(self["height"])
+        return width, height
+
+    def _layout(self):
+        """Calcule la position des zones puis replace textes et cartes"""
+        boxes = table_layout(*self._size(), [key for key in self.zones if key != "dealer"])
+        for key, zone in self.zones.items():
+            zone.box = x0, y0, x1, y1 = boxes[key]
+            self.coords(zone.panel, x0, y0, x1, y1)
+            self.coords(zone.title_item, x0 + 10, y0 + 6)
+            for line, (text_key, item) in enumerate(zone.text_items.items()):
+                x, y, _ = text_position(zone.box, text_key, line - 1)
+                self.coords(item, x, y)
+            zone.dirty = True
+        if self._shoe is not None:
+            self.coords(self._shoe, *shoe_position(self.zones["dealer"].box))
+        self._schedule()
+
+    # -------------------- État voulu --------------------
+    def set_cards(self, zone_key, cards, hide_from_index=None):
+        """Déclare les cartes d'une zone (appliquées à la prochaine image)
+
+        Args:
+            zone_key (str): "dealer" ou clé d'une place
+            cards (list): Cartes (valeur, couleur)
+            hide_from_index (int): Cartes cachées à partir de cet index
+        """
+        zone = self.zones[zone_key]
+        wanted = [None if hide_from_index and idx >= hide_from_index else tuple(card)
+                  for idx, card in enumerate(cards)]
+        if wanted != zone.cards:
+            zone.cards = wanted
+            zone.dirty = True
+            self._schedule()
+
+    def set_text(self, zone_key, text_key, text):
+        """Modifie un texte d'une zone (sans effet s'il est inchangé)"""
+        zone = self.zones[zone_key]
+        if zone.texts[text_key] != text:
+            zone.texts[text_key] = text
+            self.itemconfig(zone.text_items[text_key], text=text)
+
+    def clear(self):
+        """Retire toutes les cartes (nouvelle manche : elles seront redistribuées)"""
+        for zone in self.zones.values():
+            self._drop_items(zone, 0)
+            zone.cards = []
+
+    def render(self):
+        """Applique immédiatement les changements en attente (une image)"""
+        if self._frame_job is not None:
+            self.after_cancel(self._frame_job)
+            self._frame_job = None
+        self._frame()
+
+    def when_idle(self, callback, delay=0):
+        """Appelle `callback` après `delay` ms, une fois toutes les animations terminées"""
+        if self.is_busy():
+            self._idle_callbacks.append((callback, delay))
+        else:
+            self.after(delay, callback)
+
+    def is_busy(self):
+        """Vérifie si des cartes sont en mouvement ou des changements en attente"""
+        return bool(self._moving) or any(zone.dirty for zone in self.zones.values())
+
+    # -------------------- Boucle d'animation --------------------
+    def _schedule(self):
+        if self._frame_job is None:
+            self._frame_job = self.after_idle(self._frame)
+
+    def _frame(self):
+        """Une image : applique les zones modifiées, avance les animations, dessine"""
+        start = time.perf_counter()
+        self._frame_job = None
+        for zone in self.zones.values():
+            if zone.dirty:
+                self._apply_zone(zone)
+
+        now = time.perf_counter()
+        finished = []
+        for item, (x0, y0, x1, y1, begin, duration) in self._moving.items():
+            progress = (now - begin) / duration
+            if progress >= 1:
+                self.coords(item, x1, y1)
+                finished.append(item)
+            elif progress > 0:
+                eased = 1 - (1 - progress) ** 3
+                self.coords(item, x0 + (x1 - x0) * eased, y0 + (y1 - y0) * eased)
+        for item in finished:
+            del self._moving[item]
+
+        # Dessin forcé ici pour que la durée mesurée inclue le rendu Tk
+        self.update_idletasks()
+        self.frame_times.append(time.perf_counter() - start)
+        if self._last_frame is not None:
+            self.frame_intervals.append(start - self._last_frame)
+
+        if self._moving:
+            self._last_frame = start
+            self._frame_job = self.after(FRAME_MS, self._frame)
+        else:
+            self._last_frame = None
+            callbacks, self._idle_callbacks = self._idle_callbacks, []
+            for callback, delay in callbacks:
+                self.after(delay, callback)
+
+    def _apply_zone(self, zone):
+        """Met à jour les éléments d'une zone pour refléter zone.cards"""
+        zone.dirty = False
+        wanted = zone.cards
+        # Main différente (nouvelle manche, main suivante après un partage) : on redistribue
+        for old, new in zip(zone.shown, wanted):
+            if old is not None and new is not None and old != new:
+                self._drop_items(zone, 0)
+                break
+        self._drop_items(zone, len(wanted))
+
+        count = len(wanted)
+        for idx, card in enumerate(wanted):
+            target = card_position(zone.key, zone.box, idx, count)
+            if idx < len(zone.items):
+                item = zone.items[idx]
+                if zone.shown[idx] != card:
+                    self.itemconfig(item, image=self._image(card))
+                    zone.shown[idx] = card
+                if zone.targets[idx] != target:
+                    zone.targets[idx] = target
+                    self._move(item, target, MOVE_MS)
+            else:
+                item = self._deal(card, target)
+                zone.items.append(item)
+                zone.shown.append(card)
+                zone.targets.append(target)
+
+    def _drop_items(self, zone, keep):
+        for item in zone.items[keep:]:
+            self.delete(item)
+            self._moving.pop(item, None)
+        del zone.items[keep:], zone.shown[keep:], zone.targets[keep:]
+
+    def _image(self, card):
+        return self.back_image() if card is None else self.card_image(*card)
+
+    def _deal(self, card, target):
+        """Crée l'élément d'une carte, posé ou en route depuis le sabot"""
+        if not self.animate:
+            return self.create_image(*target, image=self._image(card), anchor="nw")
+        origin = shoe_position(self.zones["dealer"].box)
+        if self._shoe is None:
+            self._shoe = self.create_image(*origin, image=self.back_image(), anchor="nw")
+        item = self.create_image(*origin, image=self._image(card), anchor="nw")
+        now = time.perf_counter()
+        begin = max(now, self._next_deal)
+        self._next_deal = begin + DEAL_STAGGER_MS / 1000
+        self._moving[item] = (*origin, *target, begin, DEAL_MS / 1000)
+        return item
+
+    def _move(self, item, target, duration_ms):
+        if not self.animate:
+            self.coords(item, *target)
+            return
+        x0, y0 = self.coords(item)[:2]
+        self._moving[item] = (x0, y0, *target, time.perf_counter(), duration_ms / 1000)
+
+    # -------------------- Mesure --------------------
+    def frame_stats(self):
+        """Statistiques des dernières images
+
+        Returns:
+            dict: {"images": n, "moyenne_ms", "p99_ms", "max_ms", "fps"}
+                  (fps calculé sur les images animées, None s'il n'y en a pas)
+        """
+        times = sorted(self.frame_times)
+        if not times:
+            return {"images": 0, "moyenne_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0, "fps": None}
+        intervals = self.frame_intervals
+        return {
+            "images": len(times),
+            "moyenne_ms": sum(times) / len(times) * 1000,
+            "p99_ms": times[min(len(times) - 1, int(len(times) * 0.99))] * 1000,
+            "max_ms": times[-1] * 1000,
+            "fps": len(intervals) / sum(intervals) if intervals else None
+        }
\ No newline at end of file